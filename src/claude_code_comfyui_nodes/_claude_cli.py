@@ -0,0 +1,68 @@
+"""
+Helpers for invoking the Claude CLI from the nodes.
+The CLI has no long-lived management mode, so every request is its own
+process; concurrent identical read-only requests share a single process.
+"""
+
+import shutil
+import subprocess
+import threading
+from typing import Dict, Optional, Sequence, Tuple
+
+# Resolved once so each spawn skips the PATH search; falls back to the bare
+# name (and a FileNotFoundError at call time) if the CLI is not installed yet
+CLAUDE_BIN = shutil.which("claude") or "claude"
+
+__all__ = ["CLAUDE_BIN", "run_claude"]
+
+
+class _Call:
+    """A CLI invocation other threads can wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[subprocess.CompletedProcess[str]] = None
+        self.error: Optional[BaseException] = None
+
+
+_lock = threading.Lock()
+_inflight: Dict[Tuple[str, ...], _Call] = {}
+
+
+def _run(cmd: Sequence[str]) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(list(cmd), capture_output=True, text=True, check=False)
+
+
+def run_claude(args: Sequence[str], shared: bool = False) -> subprocess.CompletedProcess[str]:
+    """
+    Run `claude <args>` and capture its text output.
+    With shared=True, callers asking for the same args while a call is in
+    flight wait for it and receive its result instead of spawning another process.
+    """
+    cmd = (CLAUDE_BIN, *args)
+    if not shared:
+        return _run(cmd)
+
+    with _lock:
+        call = _inflight.get(cmd)
+        leader = call is None
+        if call is None:
+            call = _inflight[cmd] = _Call()
+
+    if leader:
+        try:
+            call.result = _run(cmd)
+        except BaseException as e:
+            call.error = e
+        finally:
+            with _lock:
+                del _inflight[cmd]
+            call.done.set()
+    else:
+        call.done.wait()
+
+    if call.error is not None:
+        raise call.error
+    # The leader sets exactly one of result and error before done
+    assert call.result is not None
+    return call.result
@@ -0,0 +1,29 @@
+"""
+File helpers shared by the Claude Code nodes.
+"""
+
+import os
+import functools
+from pathlib import Path
+
+__all__ = ["read_text_cached"]
+
+# Files larger than this are read directly instead of being held in the cache
+CACHE_MAX_BYTES = 256 * 1024
+
+
+@functools.lru_cache(maxsize=64)
+def _read_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a UTF-8 text file; mtime_ns and size key the cache so any change invalidates it."""
+    return Path(path).read_text(encoding="utf-8")
+
+
+def read_text_cached(path: str) -> str:
+    """
+    Read a UTF-8 text file, reusing the previous read while the file is unchanged.
+    Files over CACHE_MAX_BYTES bypass the cache.
+    """
+    st = os.stat(path)
+    if st.st_size > CACHE_MAX_BYTES:
+        return Path(path).read_text(encoding="utf-8")
+    return _read_cached(path, st.st_mtime_ns, st.st_size)
@@ -0,0 +1,60 @@
+"""
+JSON helpers shared by the Claude Code nodes.
+Uses orjson when it is installed and falls back to the standard library.
+"""
+
+import json
+import re
+from json import JSONDecodeError
+from typing import Any, Union
+
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except ImportError:
+    _HAVE_ORJSON = False
+
+__all__ = ["JSONDecodeError", "loads", "dumps", "dumpb"]
+
+# orjson parses integers beyond 64 bits as floats instead of failing, so
+# documents with a digit run this long are left to the stdlib
+_LONG_DIGITS = re.compile(r"[0-9]{19}")
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{19}")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document from text or bytes, with the same result as json.loads."""
+    if _HAVE_ORJSON:
+        if isinstance(data, bytes):
+            exact_with_orjson = _LONG_DIGITS_BYTES.search(data) is None
+        else:
+            exact_with_orjson = _LONG_DIGITS.search(data) is None
+        if exact_with_orjson:
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # The stdlib also accepts NaN, Infinity and lone surrogates,
+                # and raises its own JSONDecodeError for anything else
+                pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string, two-space indented when ``indent`` is set."""
+    if _HAVE_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+        except TypeError:
+            # orjson rejects a few inputs the stdlib accepts (e.g. >64-bit ints)
+            pass
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumpb(obj: Any, indent: bool = False) -> bytes:
+    """Serialize straight to UTF-8 bytes, skipping the intermediate str with orjson."""
+    if _HAVE_ORJSON:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode()
@@ -1,6 +1,51 @@
-import json
+import functools
 from typing import Tuple, Dict, Any
 
+from . import _json
+
+
+@functools.lru_cache(maxsize=128)
+def _build_arguments_json(
+    input_mode: str,
+    json_arguments: str,
+    key: str,
+    value: str,
+    base_arguments: str,
+    merge_arguments: str,
+) -> str:
+    """Merge the argument inputs into a JSON string, memoized on the raw inputs."""
+    # Parse base arguments if provided
+    try:
+        base_dict = _json.loads(base_arguments) if base_arguments else {}
+    except _json.JSONDecodeError:
+        base_dict = {}
+
+    result_dict = base_dict.copy()
+
+    if input_mode == "json":
+        try:
+            args_dict = _json.loads(json_arguments)
+            if isinstance(args_dict, dict):
+                result_dict.update(args_dict)
+        except _json.JSONDecodeError as e:
+            # Return error as arguments
+            result_dict["_error"] = f"Invalid JSON: {str(e)}"
+
+    elif input_mode == "key_value":
+        if key:
+            result_dict[key] = value
+
+    elif input_mode == "merge":
+        try:
+            merge_dict = _json.loads(merge_arguments) if merge_arguments else {}
+            if isinstance(merge_dict, dict):
+                result_dict.update(merge_dict)
+        except _json.JSONDecodeError:
+            pass
+
+    # Convert back to JSON string
+    return _json.dumps(result_dict, indent=True)
+
 
 class ClaudeCodeArguments:
     """
@@ -59,37 +104,7 @@ class ClaudeCodeArguments:
         merge_arguments: str = '{}',
     ) -> Tuple[str, str]:
         """Build arguments dictionary."""
-        
-        # Parse base arguments if provided
-        try:
-            base_dict = json.loads(base_arguments) if base_arguments else {}
-        except json.JSONDecodeError:
-            base_dict = {}
-        
-        result_dict = base_dict.copy()
-        
-        if input_mode == "json":
-            try:
-                args_dict = json.loads(json_arguments)
-                if isinstance(args_dict, dict):
-                    result_dict.update(args_dict)
-            except json.JSONDecodeError as e:
-                # Return error as arguments
-                result_dict["_error"] = f"Invalid JSON: {str(e)}"
-        
-        elif input_mode == "key_value":
-            if key:
-                result_dict[key] = value
-        
-        elif input_mode == "merge":
-            try:
-                merge_dict = json.loads(merge_arguments) if merge_arguments else {}
-                if isinstance(merge_dict, dict):
-                    result_dict.update(merge_dict)
-            except json.JSONDecodeError:
-                pass
-        
-        # Convert back to JSON string
-        result_json = json.dumps(result_dict, indent=2)
-        
-        return (result_json, result_json)
\ No newline at end of file
+        result_json = _build_arguments_json(
+            input_mode, json_arguments, key, value, base_arguments, merge_arguments
+        )
+        return (result_json, result_json)
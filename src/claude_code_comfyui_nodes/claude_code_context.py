@@ -1,7 +1,33 @@
+import io
 import os
-import json
-from typing import Any, Dict, List, Tuple
-from pathlib import Path
+import functools
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from . import _json
+
+
+def _scan_files(root: str, suffixes: Tuple[str, ...]) -> Iterator[Tuple[str, int]]:
+    """
+    Recursively yield (path, size) for files under root whose name ends with one of suffixes.
+    Like the glob walk it replaces, directories that cannot be listed are skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_files(entry.path, suffixes)
+        elif entry.is_file(follow_symlinks=False) and entry.name.endswith(suffixes):
+            yield entry.path, entry.stat().st_size
+
+
+@functools.lru_cache(maxsize=32)
+def _load_metadata(path: str, mtime_ns: int) -> str:
+    """Load and pretty-print a metadata file; mtime_ns keys the cache so rewrites invalidate it."""
+    with open(path, "rb") as f:
+        return _json.dumps(_json.loads(f.read()), indent=True)
 
 
 class ClaudeCodeContext:
@@ -57,8 +83,32 @@ class ClaudeCodeContext:
     
     OUTPUT_NODE = False
     
-    def __init__(self):
-        self.output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
+    # Number of files whose contents summary/custom modes include
+    KEY_FILE_COUNT = 5
+    # Characters of each file shown in summary mode
+    SUMMARY_CHARS = 1000
+    
+    output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
+    
+    def read_file_contents(
+        self,
+        files: List[Tuple[str, str, int]],
+        max_file_size_kb: int,
+        head_chars: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Read contents of the listed files, optionally only the first head_chars of each."""
+        file_contents = {}
+        for file_path, rel_path, file_size in files:
+            # Read file content if it's not too large
+            if file_size <= max_file_size_kb * 1024:
+                try:
+                    with open(file_path, "r", encoding="utf-8") as f:
+                        file_contents[rel_path] = f.read() if head_chars is None else f.read(head_chars)
+                except Exception as e:
+                    file_contents[rel_path] = f"[Error reading file: {e}]"
+            else:
+                file_contents[rel_path] = f"[File too large: {file_size} bytes]"
+        return file_contents
     
     def build_context(
         self,
@@ -83,90 +133,77 @@ class ClaudeCodeContext:
         
         # Parse file filters
         extensions = [ext.strip() for ext in file_filter.split(",")]
+        # "*.py" -> ".py", "py" -> ".py"; a bare "*" becomes "" and matches everything
+        suffixes = tuple(ext.lstrip("*") if ext.startswith("*") else "." + ext for ext in extensions)
         
-        # Get all files matching filters
-        all_files = []
-        for ext in extensions:
-            pattern = f"**/{ext}" if ext.startswith("*") else f"**/*.{ext}"
-            files = list(Path(folder_path).glob(pattern))
-            all_files.extend(files)
-        
-        # Remove duplicates and sort
-        all_files = sorted(set(all_files))
+        # Get all files matching filters in a single walk, ordered by path components like Path sorting
+        all_files = sorted(_scan_files(folder_path, suffixes), key=lambda item: item[0].split(os.sep))
         
         # Read metadata
-        metadata_content = ""
         metadata_path = os.path.join(folder_path, "_claude_code_metadata.json")
-        if os.path.exists(metadata_path):
-            with open(metadata_path, "r") as f:
-                metadata = json.load(f)
-                metadata_content = json.dumps(metadata, indent=2)
+        try:
+            metadata_content = _load_metadata(metadata_path, os.stat(metadata_path).st_mtime_ns)
+        except FileNotFoundError:
+            metadata_content = ""
         
-        # Build file list
-        file_list_str = ""
-        file_contents = {}
+        # Build file list; contents are only read by the modes that use them
+        file_list = io.StringIO()
+        listed_files = []
+        
+        # Every scanned path starts with the folder path, so slicing gives the relative path
+        prefix_len = len(os.path.join(folder_path, ""))
         
-        for file_path in all_files:
-            if file_path.name == "_claude_code_metadata.json":
+        for file_path, file_size in all_files:
+            rel_path = file_path[prefix_len:]
+            if os.path.basename(rel_path) == "_claude_code_metadata.json":
                 continue
-                
-            rel_path = file_path.relative_to(folder_path)
-            file_size = file_path.stat().st_size
-            
-            file_list_str += f"- {rel_path} ({file_size} bytes)\n"
             
-            # Read file content if it's not too large
-            if file_size <= max_file_size_kb * 1024:
-                try:
-                    content = file_path.read_text(encoding="utf-8")
-                    file_contents[str(rel_path)] = content
-                except Exception as e:
-                    file_contents[str(rel_path)] = f"[Error reading file: {e}]"
-            else:
-                file_contents[str(rel_path)] = f"[File too large: {file_size} bytes]"
+            file_list.write(f"- {rel_path} ({file_size} bytes)\n")
+            listed_files.append((file_path, rel_path, file_size))
+        file_list_str = file_list.getvalue()
         
         # Build context based on mode
-        context_parts = []
+        buf = io.StringIO()
         
         if base_memory:
-            context_parts.append(base_memory)
-            context_parts.append("\n\n")
+            buf.write(f"{base_memory}\n\n")
         
         if context_mode == "full_content":
-            context_parts.append(f"# Files from {output_folder}\n\n")
+            buf.write(f"# Files from {output_folder}\n\n")
+            file_contents = self.read_file_contents(listed_files, max_file_size_kb)
             for rel_path, content in file_contents.items():
-                context_parts.append(f"## {rel_path}\n\n```\n{content}\n```\n\n")
+                buf.write(f"## {rel_path}\n\n```\n{content}\n```\n\n")
         
         elif context_mode == "file_list":
-            context_parts.append(f"# Files created in {output_folder}\n\n")
-            context_parts.append(file_list_str)
-            context_parts.append("\n")
+            buf.write(f"# Files created in {output_folder}\n\n{file_list_str}\n")
             if metadata_content:
-                context_parts.append("## Execution Metadata\n\n```json\n")
-                context_parts.append(metadata_content)
-                context_parts.append("\n```\n")
+                buf.write(f"## Execution Metadata\n\n```json\n{metadata_content}\n```\n")
         
         elif context_mode == "summary":
-            context_parts.append(f"# Previous execution: {output_folder}\n\n")
-            context_parts.append("## Files created:\n")
-            context_parts.append(file_list_str)
-            context_parts.append("\n")
+            buf.write(f"# Previous execution: {output_folder}\n\n## Files created:\n{file_list_str}\n")
+            
+            # Only the start of each file is shown; one extra char tells whether it was truncated
+            file_contents = self.read_file_contents(
+                listed_files[:self.KEY_FILE_COUNT], max_file_size_kb, head_chars=self.SUMMARY_CHARS + 1
+            )
             
             # Include key files (first few or specific important ones)
-            key_files = list(file_contents.items())[:5]  # First 5 files
+            key_files = list(file_contents.items())
             if key_files:
-                context_parts.append("## Key file contents:\n\n")
+                buf.write("## Key file contents:\n\n")
                 for rel_path, content in key_files:
                     # Truncate large contents
-                    if len(content) > 1000:
-                        content = content[:1000] + "\n... [truncated]"
-                    context_parts.append(f"### {rel_path}\n\n```\n{content}\n```\n\n")
+                    if len(content) > self.SUMMARY_CHARS:
+                        content = content[:self.SUMMARY_CHARS] + "\n... [truncated]"
+                    buf.write(f"### {rel_path}\n\n```\n{content}\n```\n\n")
         
         elif context_mode == "custom" and custom_template:
             # Build file contents string
-            file_contents_str = ""
-            for rel_path, content in list(file_contents.items())[:5]:
-                file_contents_str += f"### {rel_path}\n\n```\n{content}\n```\n\n"
+            file_contents = self.read_file_contents(listed_files[:self.KEY_FILE_COUNT], max_file_size_kb)
+            file_contents_str = "".join(
+                f"### {rel_path}\n\n```\n{content}\n```\n\n"
+                for rel_path, content in file_contents.items()
+            )
             
             # Replace template variables
             formatted = custom_template.replace("{file_list}", file_list_str)
@@ -174,7 +211,7 @@ class ClaudeCodeContext:
             formatted = formatted.replace("{metadata}", metadata_content)
             formatted = formatted.replace("{output_folder}", output_folder)
             
-            context_parts.append(formatted)
+            buf.write(formatted)
         
-        memory = "".join(context_parts)
+        memory = buf.getvalue()
         return (memory,)
\ No newline at end of file
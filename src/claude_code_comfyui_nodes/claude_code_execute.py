@@ -1,16 +1,78 @@
 import os
-import json
-import uuid
+import re
+import time
+import functools
+import threading
 import subprocess
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Any, Dict, FrozenSet, List, Optional, Tuple
 from datetime import datetime
 
+from . import _json
+from ._claude_cli import CLAUDE_BIN
+
 try:
     from server import PromptServer
 except ImportError:
     PromptServer = None
 
+_MODULE_DIR = os.path.dirname(__file__)
+_COMMANDS_DIR = os.path.normpath(os.path.join(_MODULE_DIR, "..", "..", "commands"))
+
+# Command file listing is refreshed at most every COMMAND_FILES_TTL seconds
+COMMAND_FILES_TTL = 2.0
+_cmd_cache: Dict[str, Any] = {"ts": 0.0, "val": None}
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    """Write data to path with raw os.open/os.write calls."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _write_text(path: str, text: str) -> None:
+    """Write text to path."""
+    with open(path, "w") as f:
+        f.write(text)
+
+
+@functools.lru_cache(maxsize=64)
+def _read_command(path: str, mtime_ns: int) -> str:
+    """Read a command file; mtime_ns is part of the cache key so edits invalidate it."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_tools(tools: str) -> Tuple[Tuple[str, ...], bool]:
+    """Split a Tools Config string into (tool names, skip_permissions)."""
+    skip_permissions = False
+    # Check if tools contains skip_permissions flag
+    if "|skip_permissions:" in tools:
+        tools, permissions_part = tools.split("|skip_permissions:")
+        skip_permissions = permissions_part.lower() == "true"
+    return tuple(tool.strip() for tool in tools.split(",") if tool.strip()), skip_permissions
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_args_cached(arguments: str) -> Tuple[Tuple[str, str], ...]:
+    """Parse an arguments JSON string once and cache the (key, str(value)) pairs."""
+    args_dict = _json.loads(arguments)
+    if not isinstance(args_dict, dict):
+        return ()
+    return tuple((key, str(value)) for key, value in args_dict.items())
+
+
+@functools.lru_cache(maxsize=128)
+def _placeholder_pattern(keys: FrozenSet[str]) -> "re.Pattern[str]":
+    """Compile one alternation matching every ``${key}`` placeholder."""
+    return re.compile(r"\$\{(" + "|".join(re.escape(key) for key in sorted(keys)) + r")\}")
+
 
 class ClaudeCodeExecute:
     """
@@ -22,14 +84,23 @@ class ClaudeCodeExecute:
     @classmethod
     def get_command_files(cls):
         """Get list of command files from the commands folder."""
-        commands_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "commands")
+        now = time.monotonic()
+        if _cmd_cache["val"] is not None and now - _cmd_cache["ts"] < COMMAND_FILES_TTL:
+            return list(_cmd_cache["val"])
+        
         command_files = ["[Custom Command]"]  # Option for custom text input
         
-        if os.path.exists(commands_dir):
-            for file in sorted(os.listdir(commands_dir)):
-                if file.endswith('.md') or file.endswith('.txt'):
-                    command_files.append(file)
+        try:
+            with os.scandir(_COMMANDS_DIR) as it:
+                command_files.extend(sorted(
+                    entry.name for entry in it
+                    if entry.is_file() and entry.name.endswith(('.md', '.txt'))
+                ))
+        except OSError:
+            pass
         
+        _cmd_cache["ts"] = now
+        _cmd_cache["val"] = tuple(command_files)
         return command_files
     
     @classmethod
@@ -89,8 +160,9 @@ class ClaudeCodeExecute:
     
     OUTPUT_NODE = False
     
+    output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
+    
     def __init__(self):
-        self.output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
         os.makedirs(self.output_base_dir, exist_ok=True)
     
     def send_progress(self, message: str, unique_id: str):
@@ -100,19 +172,22 @@ class ClaudeCodeExecute:
     
     def replace_arguments(self, text: str, arguments: str) -> str:
         """Replace argument placeholders in text."""
+        # Nothing to substitute: skip parsing entirely
+        if not arguments or arguments == "{}" or "${" not in text:
+            return text
         try:
-            args_dict = json.loads(arguments) if arguments else {}
-            for key, value in args_dict.items():
-                placeholder = f"${{{key}}}"
-                text = text.replace(placeholder, str(value))
-        except json.JSONDecodeError:
-            pass
-        return text
+            args_dict = dict(_parse_args_cached(arguments))
+        except _json.JSONDecodeError:
+            return text
+        if not args_dict:
+            return text
+        pattern = _placeholder_pattern(frozenset(args_dict))
+        return pattern.sub(lambda match: args_dict[match.group(1)], text)
     
     def generate_output_folder(self) -> Tuple[str, str]:
         """Generate unique output folder."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = os.urandom(4).hex()
         folder_name = f"output_{timestamp}_{unique_id}"
         folder_path = os.path.join(self.output_base_dir, folder_name)
         os.makedirs(folder_path, exist_ok=True)
@@ -171,22 +246,88 @@ class ClaudeCodeExecute:
         
         return errors
     
+    def run_claude(
+        self,
+        cmd_parts: List[str],
+        prompt: str,
+        folder_path: str,
+        unique_id: str
+    ) -> Tuple[int, str, str]:
+        """Run the Claude CLI, forwarding stdout lines as progress while it runs."""
+        proc = subprocess.Popen(
+            cmd_parts,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=folder_path,
+            text=True,
+            errors="replace",
+            bufsize=1,
+        )
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+        reader_errors: List[BaseException] = []
+        
+        def drain(pipe: IO[str], sink: List[str], forward: bool) -> None:
+            # A reader that stops early would leave the CLI blocked on a full pipe
+            try:
+                for line in pipe:
+                    sink.append(line)
+                    if forward and line.strip():
+                        try:
+                            self.send_progress(line.rstrip(), unique_id)
+                        except Exception:
+                            # Progress is best effort; keep reading regardless
+                            pass
+            except BaseException as e:
+                reader_errors.append(e)
+            finally:
+                pipe.close()
+        
+        readers = [
+            threading.Thread(target=drain, args=(proc.stdout, stdout_lines, True), daemon=True),
+            threading.Thread(target=drain, args=(proc.stderr, stderr_lines, False), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        
+        # All three pipes exist because each was requested with PIPE
+        assert proc.stdin is not None
+        try:
+            proc.stdin.write(prompt)
+        except BrokenPipeError:
+            # The CLI exited early; its stderr explains why
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        
+        returncode = proc.wait()
+        for reader in readers:
+            reader.join()
+        if reader_errors:
+            raise reader_errors[0]
+        
+        return returncode, "".join(stdout_lines), "".join(stderr_lines)
+    
     def load_command_from_file(self, command_file: str) -> str:
         """Load command from file in commands folder."""
         if command_file == "[Custom Command]":
             return None
             
-        commands_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "commands")
-        file_path = os.path.join(commands_dir, command_file)
+        file_path = os.path.join(_COMMANDS_DIR, command_file)
         
-        if os.path.exists(file_path):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    return f.read()
-            except Exception as e:
-                return f"Error reading command file: {str(e)}"
+        try:
+            mtime_ns = os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
         
-        return None
+        try:
+            return _read_command(file_path, mtime_ns)
+        except Exception as e:
+            return f"Error reading command file: {str(e)}"
     
     def execute(
         self,
@@ -233,26 +374,17 @@ class ClaudeCodeExecute:
         prompt = self.build_prompt(command, memory, folder_path, previous_output)
         
         # Build CLI command
-        cmd_parts = ["claude", "-p", "--max-turns", str(max_turns)]
+        cmd_parts = [CLAUDE_BIN, "-p", "--max-turns", str(max_turns)]
         
         if model != "default":
             cmd_parts.extend(["--model", model])
         
         # Parse tools and skip_permissions from tools config
-        skip_permissions = False
-        tool_list = []
-        
-        if tools:
-            # Check if tools contains skip_permissions flag
-            if "|skip_permissions:" in tools:
-                tools_part, permissions_part = tools.split("|skip_permissions:")
-                skip_permissions = permissions_part.lower() == "true"
-                tools = tools_part
-            
-            tool_list = [tool.strip() for tool in tools.split(",") if tool.strip()]
+        tool_list, skip_permissions = _parse_tools(tools) if tools else ((), False)
+        
+        if tool_list:
             self.send_progress(f"Configuring tools: {', '.join(tool_list)}", unique_id)
-            for tool in tool_list:
-                cmd_parts.extend(["--allowedTools", tool])
+            cmd_parts += [arg for tool in tool_list for arg in ("--allowedTools", tool)]
         
         # Add skip permissions flag if enabled
         if skip_permissions:
@@ -261,27 +393,21 @@ class ClaudeCodeExecute:
         
         # Execute
         self.send_progress("Executing Claude Code...", unique_id)
-        start_time = datetime.now()
+        start_iso = datetime.now().isoformat()
+        start = time.perf_counter()
         
         try:
-            result = subprocess.run(
-                cmd_parts,
-                input=prompt,
-                cwd=folder_path,
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            returncode, stdout, stderr = self.run_claude(cmd_parts, prompt, folder_path, unique_id)
             
-            duration = (datetime.now() - start_time).total_seconds()
+            duration = time.perf_counter() - start
             
             # Extract response
-            if result.returncode == 0:
-                response = result.stdout
+            if returncode == 0:
+                response = stdout
                 self.send_progress(f"✅ Execution completed successfully in {duration:.1f}s", unique_id)
             else:
-                response = f"Error: {result.stderr}"
-                self.send_progress(f"❌ Execution failed: {result.stderr}", unique_id)
+                response = f"Error: {stderr}"
+                self.send_progress(f"❌ Execution failed: {stderr}", unique_id)
             
             # Create metadata
             metadata = {
@@ -290,9 +416,9 @@ class ClaudeCodeExecute:
                 "max_turns": max_turns,
                 "output_folder": folder_name,
                 "output_path": folder_path,
-                "timestamp": start_time.isoformat(),
-                "tools_used": tools.split(",") if tools else [],
-                "exit_code": result.returncode,
+                "timestamp": start_iso,
+                "tools_used": list(tool_list),
+                "exit_code": returncode,
                 "has_memory": bool(memory),
                 "has_arguments": arguments != "{}",
                 "has_previous": bool(previous_output),
@@ -303,23 +429,26 @@ class ClaudeCodeExecute:
             # Save metadata and raw output
             self.send_progress("Saving execution metadata...", unique_id)
             
-            with open(os.path.join(folder_path, "_claude_code_metadata.json"), "w") as f:
-                json.dump(metadata, f, indent=2)
-            
-            if result.stdout:
-                with open(os.path.join(folder_path, "_claude_raw_output.txt"), "w") as f:
-                    f.write(result.stdout)
-            
-            if result.stderr:
-                with open(os.path.join(folder_path, "_claude_raw_error.txt"), "w") as f:
-                    f.write(result.stderr)
+            # The three files are independent, so write them concurrently
+            with ThreadPoolExecutor(max_workers=3) as ex:
+                writes = [ex.submit(
+                    _write_bytes,
+                    os.path.join(folder_path, "_claude_code_metadata.json"),
+                    _json.dumpb(metadata, indent=True),
+                )]
+                if stdout:
+                    writes.append(ex.submit(_write_text, os.path.join(folder_path, "_claude_raw_output.txt"), stdout))
+                if stderr:
+                    writes.append(ex.submit(_write_text, os.path.join(folder_path, "_claude_raw_error.txt"), stderr))
+            for write in writes:
+                write.result()  # re-raise any write error
             
             # Check what files were created
-            created_files = list(Path(folder_path).glob("*"))
-            created_files = [f for f in created_files if not f.name.startswith("_claude_")]
+            with os.scandir(folder_path) as it:
+                created_files = [entry.name for entry in it if not entry.name.startswith("_claude_")]
             
             if created_files:
-                file_list = ", ".join([f.name for f in created_files[:5]])
+                file_list = ", ".join(created_files[:5])
                 if len(created_files) > 5:
                     file_list += f" and {len(created_files) - 5} more"
                 self.send_progress(f"📁 Created files: {file_list}", unique_id)
@@ -334,6 +463,6 @@ class ClaudeCodeExecute:
                 "error": str(e),
                 "execution_time": 0,
                 "output_folder": folder_name,
-                "timestamp": start_time.isoformat(),
+                "timestamp": start_iso,
             }
             return (folder_name, error_msg, metadata)
\ No newline at end of file
@@ -1,7 +1,110 @@
+import os
+import copy
 import json
-import subprocess
+import time
 from typing import Tuple, List, Dict, Any
 
+from . import _json
+from ._claude_cli import run_claude
+
+# Where the Claude CLI persists user- and local-scoped MCP servers
+CLAUDE_CONFIG_PATH = os.path.expanduser("~/.claude.json")
+# Project-scoped MCP servers, relative to the working directory
+PROJECT_MCP_CONFIG = ".mcp.json"
+
+# Example server configurations returned by the "config" action, serialised once
+EXAMPLE_MCP_CONFIGS = {
+    "slack": {
+        "command": "npx",
+        "args": ["-y", "slack-mcp-server@latest", "--transport", "stdio"],
+        "env": {
+            "SLACK_MCP_XOXC_TOKEN": "your-xoxc-token",
+            "SLACK_MCP_XOXD_TOKEN": "your-xoxd-token"
+        }
+    },
+    "browser-tools": {
+        "command": "browser-tools-mcp"
+    },
+    "notion": {
+        "command": "notion-mcp-server",
+        "env": {
+            "NOTION_TOKEN": "your-notion-token"
+        }
+    },
+    "figma": {
+        "command": "figma-developer-mcp",
+        "args": ["--figma-api-key=your-api-key", "--stdio"]
+    }
+}
+EXAMPLE_MCP_CONFIGS_TEXT = "Example MCP Configurations:\n\n" + json.dumps(EXAMPLE_MCP_CONFIGS, indent=2)
+
+# path -> (st_mtime_ns, (top-level mcpServers, {project path: mcpServers}))
+_config_cache: Dict[str, Tuple[int, Tuple[Dict[str, Any], Dict[str, Any]]]] = {}
+
+
+def _load_mcp_servers(path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Return a config file's top-level mcpServers and each project's mcpServers,
+    reusing the previous result while the file's mtime is unchanged. Only the
+    server entries are cached, not the rest of the config.
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _config_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    with open(path, "rb") as f:
+        config = _json.loads(f.read())
+    project_servers = {
+        project: settings["mcpServers"]
+        for project, settings in (config.get("projects") or {}).items()
+        if settings.get("mcpServers")
+    }
+    servers = (config.get("mcpServers") or {}, project_servers)
+    _config_cache[path] = (mtime_ns, servers)
+    return servers
+
+
+def _listed_server(name: str, server: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    The fields the MCP list exposes for one server entry. env and headers
+    hold credentials and would otherwise end up in workflow outputs.
+    """
+    fields = ("command", "args") if server.get("type", "stdio") == "stdio" else ("type", "url")
+    return {"name": name, **{field: copy.deepcopy(server[field]) for field in fields if field in server}}
+
+
+def read_mcp_servers() -> List[Dict[str, Any]]:
+    """
+    Build the MCP list straight from the CLI's config files.
+    Raises FileNotFoundError when neither config file exists.
+    """
+    scopes = []
+    found = False
+    for path in (CLAUDE_CONFIG_PATH, os.path.abspath(PROJECT_MCP_CONFIG)):
+        try:
+            scopes.append(_load_mcp_servers(path))
+            found = True
+        except FileNotFoundError:
+            scopes.append(({}, {}))
+    if not found:
+        raise FileNotFoundError(CLAUDE_CONFIG_PATH)
+    
+    (user_servers, local_servers), (project_servers, _) = scopes
+    
+    # Same precedence as the CLI: local overrides project overrides user
+    servers: Dict[str, Any] = {}
+    for scope in (user_servers, project_servers, local_servers.get(os.getcwd()) or {}):
+        servers.update(scope)
+    return [_listed_server(name, server) for name, server in servers.items()]
+
+
+def _config_mtime_ns() -> int:
+    """Modification time of the Claude CLI config, or 0 if it does not exist."""
+    try:
+        return os.stat(CLAUDE_CONFIG_PATH).st_mtime_ns
+    except OSError:
+        return 0
+
 
 class ClaudeCodeMCP:
     """
@@ -44,22 +147,46 @@ class ClaudeCodeMCP:
     
     OUTPUT_NODE = False
     
+    # Seconds a `claude mcp list` result is reused before the CLI is asked again
+    MCP_LIST_TTL = 5.0
+    _MCP_LIST_CACHE: Dict[str, Any] = {"ts": 0.0, "mtime": 0, "data": None}
+    
+    @classmethod
+    def invalidate_mcp_list(cls) -> None:
+        """Force the next get_mcp_list call to query the CLI."""
+        cls._MCP_LIST_CACHE["ts"] = 0.0
+    
     def get_mcp_list(self) -> List[Dict[str, Any]]:
         """Get list of configured MCPs."""
+        # Reading the config is far cheaper than booting the CLI; anything
+        # missing, unreadable or malformed falls back to asking the CLI
         try:
-            result = subprocess.run(
-                ["claude", "mcp", "list", "--json"],
-                capture_output=True,
-                text=True,
-                check=False
-            )
+            return read_mcp_servers()
+        except (OSError, ValueError, TypeError, AttributeError):
+            pass
+        
+        cache = self._MCP_LIST_CACHE
+        mtime = _config_mtime_ns()
+        if (
+            cache["data"] is not None
+            and cache["mtime"] == mtime
+            and time.monotonic() - cache["ts"] < self.MCP_LIST_TTL
+        ):
+            return copy.deepcopy(cache["data"])
+        
+        try:
+            # Parallel graph executions listing at once share one CLI process
+            result = run_claude(["mcp", "list", "--json"], shared=True)
             
             if result.returncode == 0:
-                return json.loads(result.stdout)
+                mcp_list = json.loads(result.stdout)
             else:
                 return []
         except Exception:
             return []
+        
+        cache.update(ts=time.monotonic(), mtime=mtime, data=mcp_list)
+        return copy.deepcopy(mcp_list)
     
     def manage_mcp(
         self,
@@ -100,11 +227,10 @@ class ClaudeCodeMCP:
                 config_dict = json.loads(mcp_config) if mcp_config else {}
                 
                 # Build command
-                cmd = ["claude", "mcp", "add-json", "--scope", "user", mcp_name, json.dumps(config_dict)]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+                result = run_claude(["mcp", "add-json", "--scope", "user", mcp_name, json.dumps(config_dict)])
                 
                 if result.returncode == 0:
+                    self.invalidate_mcp_list()
                     return (f"Successfully enabled MCP: {mcp_name}", f"enabled:{mcp_name}", self.get_mcp_list())
                 else:
                     return (f"Error enabling MCP: {result.stderr}", "error", [])
@@ -119,10 +245,10 @@ class ClaudeCodeMCP:
                 return ("Error: MCP name required", "error", [])
             
             try:
-                cmd = ["claude", "mcp", "remove", "--scope", "user", mcp_name]
-                result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+                result = run_claude(["mcp", "remove", "--scope", "user", mcp_name])
                 
                 if result.returncode == 0:
+                    self.invalidate_mcp_list()
                     return (f"Successfully disabled MCP: {mcp_name}", f"disabled:{mcp_name}", self.get_mcp_list())
                 else:
                     return (f"Error disabling MCP: {result.stderr}", "error", [])
@@ -131,34 +257,7 @@ class ClaudeCodeMCP:
                 return (f"Error: {str(e)}", "error", [])
         
         elif action == "config":
-            # Return example configurations
-            examples = {
-                "slack": {
-                    "command": "npx",
-                    "args": ["-y", "slack-mcp-server@latest", "--transport", "stdio"],
-                    "env": {
-                        "SLACK_MCP_XOXC_TOKEN": "your-xoxc-token",
-                        "SLACK_MCP_XOXD_TOKEN": "your-xoxd-token"
-                    }
-                },
-                "browser-tools": {
-                    "command": "browser-tools-mcp"
-                },
-                "notion": {
-                    "command": "notion-mcp-server",
-                    "env": {
-                        "NOTION_TOKEN": "your-notion-token"
-                    }
-                },
-                "figma": {
-                    "command": "figma-developer-mcp",
-                    "args": ["--figma-api-key=your-api-key", "--stdio"]
-                }
-            }
-            
-            info = "Example MCP Configurations:\n\n"
-            info += json.dumps(examples, indent=2)
-            
-            return (info, "config", [examples])
+            # A copy, so downstream nodes that edit it cannot change later results
+            return (EXAMPLE_MCP_CONFIGS_TEXT, "config", [copy.deepcopy(EXAMPLE_MCP_CONFIGS)])
         
         return ("Unknown action", "error", [])
\ No newline at end of file
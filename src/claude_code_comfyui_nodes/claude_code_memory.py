@@ -1,5 +1,10 @@
 import os
-from typing import Tuple
+from typing import Any, Dict, List, Tuple
+
+from ._files import read_text_cached
+
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_MEMORIES_DIR = os.path.join(os.path.dirname(os.path.dirname(_MODULE_DIR)), "memories")
 
 
 class ClaudeCodeMemory:
@@ -10,17 +15,26 @@ class ClaudeCodeMemory:
     
     CATEGORY = "claude_code/helpers"
     
+    _memories_dir = _MEMORIES_DIR
+    # Directory listing, rebuilt only when the folder's mtime changes
+    _memories_cache: Dict[str, Any] = {"mtime": -1, "files": None}
+    
     @classmethod
     def get_memory_files(cls):
         """Get list of memory files from the memories folder."""
-        memories_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "memories")
         memory_files = ["[Custom Memory]"]  # Option for custom text input
         
-        if os.path.exists(memories_dir):
-            for file in sorted(os.listdir(memories_dir)):
-                if file.endswith('.md') or file.endswith('.txt'):
-                    memory_files.append(file)
+        cache = cls._memories_cache
+        try:
+            mtime = os.stat(cls._memories_dir).st_mtime_ns
+            if cache["mtime"] != mtime:
+                with os.scandir(cls._memories_dir) as it:
+                    files = sorted(entry.name for entry in it if entry.name.endswith(('.md', '.txt')))
+                cache.update(mtime=mtime, files=tuple(files))
+        except OSError:
+            return memory_files
         
+        memory_files.extend(cache["files"])
         return memory_files
     
     @classmethod
@@ -75,71 +89,60 @@ class ClaudeCodeMemory:
     ) -> Tuple[str, str]:
         """Build memory from various sources."""
         
-        memory_parts = []
-        
-        # Start with previous memory if provided
-        if append_to:
-            memory_parts.append(append_to)
-            memory_parts.append("\n\n")
+        body = ""
         
         # Add memory based on type
         if memory_type == "text":
-            if text_memory:
-                memory_parts.append(text_memory)
+            body = text_memory
         
         elif memory_type == "memory_file":
             if memory_file != "[Custom Memory]":
-                memories_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "memories")
-                memory_file_path = os.path.join(memories_dir, memory_file)
-                if os.path.exists(memory_file_path):
-                    try:
-                        with open(memory_file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        memory_parts.append(content)
-                    except Exception as e:
-                        memory_parts.append(f"Error reading memory file {memory_file}: {str(e)}")
-                else:
-                    memory_parts.append(f"Error: Memory file not found: {memory_file}")
-            elif text_memory:
+                memory_file_path = os.path.join(self._memories_dir, memory_file)
+                try:
+                    body = read_text_cached(memory_file_path)
+                except FileNotFoundError:
+                    body = f"Error: Memory file not found: {memory_file}"
+                except Exception as e:
+                    body = f"Error reading memory file {memory_file}: {str(e)}"
+            else:
                 # Fall back to text memory if custom
-                memory_parts.append(text_memory)
+                body = text_memory
         
         elif memory_type == "file":
-            if file_path and os.path.exists(file_path):
+            if file_path:
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    memory_parts.append(content)
+                    body = read_text_cached(file_path)
+                except FileNotFoundError:
+                    body = f"Error: File not found: {file_path}"
                 except Exception as e:
-                    memory_parts.append(f"Error reading file {file_path}: {str(e)}")
-            elif file_path:
-                memory_parts.append(f"Error: File not found: {file_path}")
+                    body = f"Error reading file {file_path}: {str(e)}"
         
         elif memory_type == "claude_md":
-            if claude_md_content:
-                memory_parts.append(claude_md_content)
+            body = claude_md_content
         
         elif memory_type == "combined":
             # Combine all available sources
+            memory_parts: List[str] = []
+            
             if claude_md_content:
-                memory_parts.append(claude_md_content)
-                memory_parts.append("\n\n")
+                memory_parts.extend((claude_md_content, "\n\n"))
             
             if text_memory:
-                memory_parts.append("## Additional Context\n\n")
-                memory_parts.append(text_memory)
-                memory_parts.append("\n\n")
+                memory_parts.extend(("## Additional Context\n\n", text_memory, "\n\n"))
             
-            if file_path and os.path.exists(file_path):
+            if file_path:
                 try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    memory_parts.append("## File Content\n\n")
-                    memory_parts.append(content)
+                    memory_parts.extend(("## File Content\n\n", read_text_cached(file_path)))
+                except FileNotFoundError:
+                    # A missing file is simply left out of the combined memory
+                    pass
                 except Exception as e:
                     memory_parts.append(f"Error reading file: {str(e)}")
+            
+            body = "".join(memory_parts)
         
-        memory = "".join(memory_parts).strip()
+        # Start with previous memory if provided
+        memory = (f"{append_to}\n\n{body}" if append_to else body).strip()
         
         # Return both as custom type and string for compatibility
         return (memory, memory)
\ No newline at end of file
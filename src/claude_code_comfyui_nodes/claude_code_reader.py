@@ -1,6 +1,92 @@
 import os
 import json
-from typing import Any, Dict, List, Tuple
+import fnmatch
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ._files import read_text_cached
+
+# Upper bound on concurrent file reads in read_all mode
+READ_WORKERS = 8
+
+
+def _read_block(rel_path: str, file_path: str) -> str:
+    """Format one file for read_all, embedding the error if it cannot be read."""
+    try:
+        return f"=== {rel_path} ===\n{read_text_cached(file_path)}\n"
+    except Exception as e:
+        return f"=== {rel_path} ===\nError reading file: {e}\n"
+
+
+def _list_dir(dir_path: str) -> List["os.DirEntry[str]"]:
+    """Entries of a directory in listing order; like glob, an unreadable one has none."""
+    try:
+        with os.scandir(dir_path) as it:
+            return list(it)
+    except OSError:
+        return []
+
+
+def _rlist(dir_path: str, dirs_only: bool) -> Iterator["os.DirEntry[str]"]:
+    """Non-hidden entries below dir_path, each directory followed by its contents, as "**" visits them."""
+    for entry in _list_dir(dir_path):
+        if entry.name.startswith("."):
+            continue
+        is_dir = entry.is_dir(follow_symlinks=False)
+        if is_dir or not dirs_only:
+            yield entry
+        if is_dir:
+            yield from _rlist(entry.path, dirs_only)
+
+
+def _glob(
+    root: str, segments: Tuple[str, ...], dirs_only: bool
+) -> Iterator[Tuple[str, Optional["os.DirEntry[str]"]]]:
+    """
+    Lazily yield (path, entry) for root joined with the pattern segments, in
+    the order glob produces them: every match of the leading segments is
+    expanded by the last one before the next is. entry is None for a
+    directory that "**" matches as itself.
+    """
+    if not segments:
+        yield root, None
+        return
+    segment = segments[-1]
+    for dir_path, _ in _glob(root, segments[:-1], True):
+        if segment == "**":
+            yield dir_path, None
+            for entry in _rlist(dir_path, dirs_only):
+                yield entry.path, entry
+            continue
+        for entry in _list_dir(dir_path):
+            # Dot names only match a segment that itself starts with a dot
+            if entry.name.startswith(".") and not segment.startswith("."):
+                continue
+            if fnmatch.fnmatchcase(entry.name, segment) and (
+                not dirs_only or entry.is_dir(follow_symlinks=False)
+            ):
+                yield entry.path, entry
+
+
+def _iter_matches(root: str, pattern: str, limit: int) -> Iterator[Tuple[str, os.stat_result]]:
+    """
+    Yield (path, stat) for files matching glob's root/**/pattern, in glob's
+    order, stopping after limit. Patterns may contain directory parts
+    ("deep/*.md", "**/*.md"); files glob would report twice are yielded once.
+    """
+    segments = ("**",) + tuple(s for s in pattern.replace(os.sep, "/").split("/") if s)
+    found = set()
+    for path, entry in _glob(root, segments, False):
+        if (
+            entry is not None
+            and entry.is_file()
+            and entry.name != "_claude_code_metadata.json"
+            and path not in found
+        ):
+            found.add(path)
+            yield path, entry.stat()
+            if len(found) >= limit:
+                return
 
 
 class ClaudeCodeReader:
@@ -49,8 +135,7 @@ class ClaudeCodeReader:
     
     OUTPUT_NODE = True
     
-    def __init__(self):
-        self.output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
+    output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
     
     def read_output(
         self,
@@ -67,61 +152,51 @@ class ClaudeCodeReader:
         if not os.path.exists(folder_path):
             return (f"Error: Output folder '{output_folder}' not found", [], "")
         
-        # Read metadata if it exists
-        metadata = ""
-        metadata_path = os.path.join(folder_path, "_claude_code_metadata.json")
-        if os.path.exists(metadata_path):
-            with open(metadata_path, "r") as f:
-                metadata = f.read()
+        # Read metadata if it exists; unchanged files come from the read cache
+        try:
+            metadata = read_text_cached(os.path.join(folder_path, "_claude_code_metadata.json"))
+        except FileNotFoundError:
+            metadata = ""
         
-        # Get list of files
-        import glob
-        pattern_path = os.path.join(folder_path, "**", file_pattern)
-        files = glob.glob(pattern_path, recursive=True)
-        
-        # Filter out the metadata file
-        files = [f for f in files if not f.endswith("_claude_code_metadata.json")]
-        
-        # Create file list
+        # Get up to max_files matching files, skipping the metadata file
+        files = []
+        rel_paths = []
         file_list = []
-        for file_path in files[:max_files]:
+        for file_path, st in _iter_matches(folder_path, file_pattern, max_files):
             rel_path = os.path.relpath(file_path, folder_path)
-            file_info = {
+            files.append(file_path)
+            rel_paths.append(rel_path)
+            file_list.append({
                 "path": rel_path,
-                "size": os.path.getsize(file_path),
+                "size": st.st_size,
                 "type": os.path.splitext(file_path)[1],
-            }
-            file_list.append(file_info)
+            })
         
         # Read file contents based on mode
         file_contents = ""
         
         if read_mode == "list_files":
-            file_contents = f"Files in {output_folder}:\n"
-            for info in file_list:
-                file_contents += f"- {info['path']} ({info['size']} bytes)\n"
+            lines = [f"Files in {output_folder}:"]
+            lines.extend(f"- {info['path']} ({info['size']} bytes)" for info in file_list)
+            lines.append("")  # keep the trailing newline
+            file_contents = "\n".join(lines)
         
         elif read_mode == "read_all":
-            contents_parts = []
-            for file_path in files[:max_files]:
-                rel_path = os.path.relpath(file_path, folder_path)
-                try:
-                    with open(file_path, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    contents_parts.append(f"=== {rel_path} ===\n{content}\n")
-                except Exception as e:
-                    contents_parts.append(f"=== {rel_path} ===\nError reading file: {e}\n")
+            if len(files) > 1:
+                # Reads are I/O bound, so overlap them; map keeps the original order
+                with ThreadPoolExecutor(max_workers=min(READ_WORKERS, len(files))) as pool:
+                    contents_parts = list(pool.map(_read_block, rel_paths, files))
+            else:
+                contents_parts = list(map(_read_block, rel_paths, files))
             file_contents = "\n".join(contents_parts)
         
         elif read_mode == "read_specific" and specific_file:
             specific_path = os.path.join(folder_path, specific_file)
-            if os.path.exists(specific_path):
-                try:
-                    with open(specific_path, "r", encoding="utf-8") as f:
-                        file_contents = f.read()
-                except Exception as e:
-                    file_contents = f"Error reading file: {e}"
-            else:
+            try:
+                file_contents = read_text_cached(specific_path)
+            except FileNotFoundError:
                 file_contents = f"File '{specific_file}' not found in output folder"
+            except Exception as e:
+                file_contents = f"Error reading file: {e}"
         
         return (file_contents, file_list, metadata)
\ No newline at end of file
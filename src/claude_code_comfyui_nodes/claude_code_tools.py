@@ -1,4 +1,14 @@
-from typing import Tuple, List
+import re
+from typing import Tuple, FrozenSet
+
+# Commas plus the whitespace around them; spaces inside a tool spec such as
+# "Bash(npm run test)" are part of the tool name and must survive the split
+_CSV_SPLIT = re.compile(r"\s*,\s*").split
+
+
+def _split_tools(tools: str) -> FrozenSet[str]:
+    """Split a comma-separated tool list, dropping blanks."""
+    return frozenset(filter(None, _CSV_SPLIT(tools.strip())))
 
 
 class ClaudeCodeTools:
@@ -9,15 +19,19 @@ class ClaudeCodeTools:
     
     CATEGORY = "claude_code/helpers"
     
-    # Tool presets
+    # Display order for the built-in tools; anything else is appended sorted
+    _TOOL_ORDER = ("Read", "Write", "Edit", "MultiEdit", "Bash", "Grep", "Glob", "LS", "WebFetch", "WebSearch")
+    _KNOWN_TOOLS = frozenset(_TOOL_ORDER)
+    
+    # Tool presets, built once at import
     PRESETS = {
-        "all": "Read,Write,Edit,MultiEdit,Bash,Grep,Glob,LS,WebFetch,WebSearch",
-        "read_only": "Read,Grep,Glob,LS",
-        "file_ops": "Read,Write,Edit,MultiEdit,Grep,Glob,LS",
-        "code_dev": "Read,Write,Edit,MultiEdit,Bash,Grep,Glob,LS",
-        "web": "WebFetch,WebSearch",
-        "minimal": "Read,Write",
-        "none": "",
+        "all": frozenset({"Read", "Write", "Edit", "MultiEdit", "Bash", "Grep", "Glob", "LS", "WebFetch", "WebSearch"}),
+        "read_only": frozenset({"Read", "Grep", "Glob", "LS"}),
+        "file_ops": frozenset({"Read", "Write", "Edit", "MultiEdit", "Grep", "Glob", "LS"}),
+        "code_dev": frozenset({"Read", "Write", "Edit", "MultiEdit", "Bash", "Grep", "Glob", "LS"}),
+        "web": frozenset({"WebFetch", "WebSearch"}),
+        "minimal": frozenset({"Read", "Write"}),
+        "none": frozenset(),
     }
     
     @classmethod
@@ -74,8 +88,7 @@ class ClaudeCodeTools:
         """Configure tool list."""
         
         # Start with preset
-        tools_str = self.PRESETS.get(preset, "")
-        tools_set = set(tool.strip() for tool in tools_str.split(",") if tool.strip())
+        tools_set = set(self.PRESETS.get(preset, ()))
         
         # Apply boolean toggles (only if using custom selection)
         if preset == "none":
@@ -94,17 +107,16 @@ class ClaudeCodeTools:
         
         # Add custom tools
         if custom_tools:
-            custom_set = set(tool.strip() for tool in custom_tools.split(",") if tool.strip())
-            tools_set.update(custom_set)
+            tools_set.update(_split_tools(custom_tools))
         
         # Remove specified tools
         if remove_tools:
-            remove_set = set(tool.strip() for tool in remove_tools.split(",") if tool.strip())
-            tools_set.difference_update(remove_set)
+            tools_set.difference_update(_split_tools(remove_tools))
         
-        # Convert back to comma-separated string
-        tools_list = sorted(list(tools_set))
-        tools_str = ",".join(tools_list)
+        # Convert back to comma-separated string in a stable order
+        tools_str = ",".join(
+            [tool for tool in self._TOOL_ORDER if tool in tools_set] + sorted(tools_set - self._KNOWN_TOOLS)
+        )
         
         # Include skip_permissions in the tools string for the Execute node
         tools_config = f"{tools_str}|skip_permissions:{skip_permissions}"
@@ -3,12 +3,19 @@ Claude Reddit Scraper Node
 Scrapes Reddit posts and comments using Claude Code with Playwright MCP
 """
 
-import json
+import functools
+import re
 import subprocess
-from typing import Dict, Any, Tuple, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple, Optional
 from datetime import datetime
 import os
-import uuid
+from urllib.parse import quote_plus
+
+from . import _json
+from ._claude_cli import CLAUDE_BIN, run_claude
+from .claude_code_mcp import ClaudeCodeMCP
 
 try:
     from server import PromptServer
@@ -16,6 +23,263 @@ except ImportError:
     PromptServer = None
 
 
+# Default Linux pipe capacity; prompts up to this size are written to
+# Claude's stdin in one go instead of through Popen.communicate()
+_PIPE_BUFFER_BYTES = 64 * 1024
+
+# Leading "/r/", "r/" or "/" on a subreddit, and "/u/", "u/", "/user/" or
+# "user/" on a username, with any whitespace before them
+_SUBREDDIT_PREFIX = re.compile(r"^\s*/?(?:r/)?")
+_USER_PREFIX = re.compile(r"^\s*/?(?:u(?:ser)?/)?")
+
+# Prompt pieces for build_scraping_prompt. Sections containing {placeholders}
+# are filled with str.format; the rest is appended verbatim.
+_PROMPT_HEAD = (
+    "# Command\n"
+    "Use the Playwright MCP to scrape Reddit data from: {url}\n\n"
+    "## Scraping Instructions:\n"
+    "1. Navigate to the URL\n"
+    "2. Wait for the page to load completely\n"
+    "3. Scrape the following data:\n"
+)
+
+_POSTS_SECTION = (
+    "\n### Posts (first {max_items} items):\n"
+    "- Title\n"
+    "- URL/link\n"
+    "- Subreddit\n"
+)
+
+_POST_METADATA = (
+    "- Author username\n"
+    "- Score/upvotes\n"
+    "- Number of comments\n"
+    "- Post time\n"
+    "- Awards (if any)\n"
+    "- Post flair\n"
+    "- Whether it's pinned/stickied\n"
+)
+
+_COMMENTS_TOP_POST = (
+    "\n### Comments (from first {max_items} posts):\n"
+    "- Find the post with the most comments (at least 20+ comments)\n"
+    "- Click into that specific post to view the full comment thread\n"
+)
+
+_COMMENTS_EACH_POST = (
+    "\n### Comments (for each scraped post):\n"
+    "- Click into each post\n"
+)
+
+_COMMENTS_DETAIL = (
+    "- Scrape ALL visible comments up to {max_comment_depth} levels deep\n"
+    "- For each comment, capture:\n"
+    "  * Full comment text (don't truncate)\n"
+    "  * Author username\n"
+    "  * Score/upvotes\n"
+    "  * Timestamp\n"
+    "  * Comment ID (if available)\n"
+    "  * Parent comment ID (to preserve threading)\n"
+    "  * Depth level (0=top-level, 1=reply, 2=reply-to-reply, etc.)\n"
+    "  * Awards (if any)\n"
+    "  * Whether it's highlighted/pinned\n"
+    "- Expand 'Continue this thread' links to get deeper comments\n"
+    "- Include deleted/removed comments with appropriate markers\n"
+    "- Preserve the exact thread hierarchy in nested structure\n"
+)
+
+_METADATA_SECTION = (
+    "\n### Subreddit Metadata:\n"
+    "- Subreddit name and description\n"
+    "- Member count\n"
+    "- Rules\n"
+    "- Moderators (if visible)\n"
+    "- Pinned posts\n"
+    "- Sidebar information\n"
+)
+
+
+def _mode_fragments(with_metadata: bool) -> Dict[Tuple[str, bool], str]:
+    """Instruction sections for each scrape mode, in prompt order."""
+    posts = _POSTS_SECTION + (_POST_METADATA if with_metadata else "")
+    return {
+        ("posts", with_metadata): posts,
+        ("comments", with_metadata): _COMMENTS_TOP_POST + _COMMENTS_DETAIL,
+        ("both", with_metadata): posts + _COMMENTS_EACH_POST + _COMMENTS_DETAIL,
+        ("metadata", with_metadata): _METADATA_SECTION,
+    }
+
+
+# Every (scrape_mode, include_metadata) combination, resolved at import
+_PROMPT_FRAGMENTS = {**_mode_fragments(True), **_mode_fragments(False)}
+
+# Example output structure embedded in the prompt, verbatim
+_REDDIT_JSON_SCHEMA = """\
+```json
+{
+  "post": {
+    "title": "...",
+    "url": "...",
+    "author": "...",
+    "score": 123,
+    "content": "...",
+    "num_comments": 45
+  },
+  "comments": [
+    {
+      "id": "abc123",
+      "parent_id": null,
+      "author": "username",
+      "text": "Full comment text...",
+      "score": 10,
+      "timestamp": "2 hours ago",
+      "depth": 0,
+      "awards": 1,
+      "is_highlighted": false,
+      "replies": [
+        {
+          "id": "def456",
+          "parent_id": "abc123",
+          "author": "another_user",
+          "text": "Reply text...",
+          "score": 5,
+          "timestamp": "1 hour ago",
+          "depth": 1,
+          "replies": []
+        }
+      ]
+    }
+  ],
+  "metadata": {
+    "total_comments_scraped": 45,
+    "max_depth_reached": 3,
+    "scraped_at": "2024-06-16T16:00:00Z"
+  }
+}
+```
+"""
+
+_DATA_PROCESSING = (
+    "\n## Data Processing:\n"
+    "- Structure the data as clean JSON with this format:\n"
+    + _REDDIT_JSON_SCHEMA
+    + "- Use consistent field names\n"
+    "- Handle missing data gracefully (use null)\n"
+    "- Include a summary count of items scraped\n"
+    "- If any errors occur, include them in an 'errors' field\n"
+)
+
+_OUTPUT_INSTRUCTIONS = (
+    "\n# Output Instructions\n"
+    "Save all scraped data to a file named 'reddit_data.json' in: {output_folder}\n"
+    "Also create a 'scraping_summary.txt' file with:\n"
+    "- Post title and URL\n"
+    "- Total comments scraped\n"
+    "- Top 5 comments by score (with author and score)\n"
+    "- Most controversial comments (lowest/negative scores)\n"
+    "- Thread depth statistics\n"
+    "- Key discussion themes or topics mentioned\n"
+    "- Any issues encountered\n"
+    "- Timestamp of scraping\n"
+    "\nDo not create files elsewhere.\n"
+)
+
+
+# Node inputs; static, so built once and shared by every INPUT_TYPES call
+_INPUT_TYPES = {
+    "required": {
+        "source_type": (
+            ["url", "subreddit", "search", "user"],
+            {
+                "default": "subreddit",
+                "tooltip": "Type of Reddit source to scrape",
+            },
+        ),
+        "source": (
+            "STRING",
+            {
+                "default": "programming",
+                "tooltip": "Reddit URL, subreddit name, search query, or username",
+            },
+        ),
+        "scrape_mode": (
+            ["comments", "posts", "both", "metadata"],
+            {"default": "comments", "tooltip": "What to scrape from Reddit"},
+        ),
+        "max_items": (
+            "INT",
+            {
+                "default": 10,
+                "min": 1,
+                "max": 100,
+                "tooltip": "Maximum items to scrape",
+            },
+        ),
+        "model": (
+            ["default", "sonnet", "opus"],
+            {"default": "sonnet", "tooltip": "Claude model to use"},
+        ),
+    },
+    "optional": {
+        "sort_by": (
+            ["hot", "new", "top", "rising", "controversial"],
+            {
+                "default": "hot",
+                "tooltip": "Sort order for posts (subreddit mode only)",
+            },
+        ),
+        "time_filter": (
+            ["hour", "day", "week", "month", "year", "all"],
+            {
+                "default": "day",
+                "tooltip": "Time filter for top/controversial posts",
+            },
+        ),
+        "include_metadata": (
+            "BOOLEAN",
+            {
+                "default": True,
+                "tooltip": "Include post metadata (author, score, date, etc)",
+            },
+        ),
+        "max_comment_depth": (
+            "INT",
+            {
+                "default": 2,
+                "min": 1,
+                "max": 10,
+                "tooltip": "Maximum comment thread depth to scrape",
+            },
+        ),
+        "memory": (
+            "CLAUDE_MEMORY",
+            {"tooltip": "Additional context/memory for Claude"},
+        ),
+        "previous_output": (
+            "CLAUDE_OUTPUT",
+            {"tooltip": "Output from previous Claude execution"},
+        ),
+    },
+    "hidden": {"unique_id": "UNIQUE_ID"},
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _prompt_body(
+    url: str,
+    scrape_mode: str,
+    max_items: int,
+    max_comment_depth: int,
+    include_metadata: bool,
+) -> bytes:
+    """Everything between the memory header and the output instructions, UTF-8 encoded."""
+    fragment = _PROMPT_FRAGMENTS.get((scrape_mode, bool(include_metadata)), "")
+    body = (_PROMPT_HEAD + fragment).format(
+        url=url, max_items=max_items, max_comment_depth=max_comment_depth
+    )
+    return (body + _DATA_PROCESSING).encode()
+
+
 class ClaudeRedditScraper:
     """
     Scrape Reddit posts and comments using Claude Code with Playwright MCP.
@@ -26,82 +290,7 @@ class ClaudeRedditScraper:
 
     @classmethod
     def INPUT_TYPES(cls):
-        return {
-            "required": {
-                "source_type": (
-                    ["url", "subreddit", "search", "user"],
-                    {
-                        "default": "subreddit",
-                        "tooltip": "Type of Reddit source to scrape",
-                    },
-                ),
-                "source": (
-                    "STRING",
-                    {
-                        "default": "programming",
-                        "tooltip": "Reddit URL, subreddit name, search query, or username",
-                    },
-                ),
-                "scrape_mode": (
-                    ["comments", "posts", "both", "metadata"],
-                    {"default": "comments", "tooltip": "What to scrape from Reddit"},
-                ),
-                "max_items": (
-                    "INT",
-                    {
-                        "default": 10,
-                        "min": 1,
-                        "max": 100,
-                        "tooltip": "Maximum items to scrape",
-                    },
-                ),
-                "model": (
-                    ["default", "sonnet", "opus"],
-                    {"default": "sonnet", "tooltip": "Claude model to use"},
-                ),
-            },
-            "optional": {
-                "sort_by": (
-                    ["hot", "new", "top", "rising", "controversial"],
-                    {
-                        "default": "hot",
-                        "tooltip": "Sort order for posts (subreddit mode only)",
-                    },
-                ),
-                "time_filter": (
-                    ["hour", "day", "week", "month", "year", "all"],
-                    {
-                        "default": "day",
-                        "tooltip": "Time filter for top/controversial posts",
-                    },
-                ),
-                "include_metadata": (
-                    "BOOLEAN",
-                    {
-                        "default": True,
-                        "tooltip": "Include post metadata (author, score, date, etc)",
-                    },
-                ),
-                "max_comment_depth": (
-                    "INT",
-                    {
-                        "default": 2,
-                        "min": 1,
-                        "max": 10,
-                        "tooltip": "Maximum comment thread depth to scrape",
-                    },
-                ),
-                "memory": (
-                    "CLAUDE_MEMORY",
-                    {"tooltip": "Additional context/memory for Claude"},
-                ),
-                "previous_output": (
-                    "CLAUDE_OUTPUT",
-                    {"tooltip": "Output from previous Claude execution"},
-                ),
-            },
-            "hidden": {"unique_id": "UNIQUE_ID"},
-        }
+        return _INPUT_TYPES
 
     RETURN_TYPES = ("CLAUDE_OUTPUT", "JSON", "STRING", "INT")
     RETURN_NAMES = ("output", "scraped_data", "summary", "item_count")
@@ -110,9 +299,14 @@ class ClaudeRedditScraper:
 
     OUTPUT_NODE = False
 
-    def __init__(self):
-        self.output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
-        os.makedirs(self.output_base_dir, exist_ok=True)
+    # When Playwright MCP was last seen registered; trusted for as long as the
+    # MCP manager trusts its cached list, since either node (or the user) may
+    # remove the server afterwards
+    PLAYWRIGHT_MCP_TTL = ClaudeCodeMCP.MCP_LIST_TTL
+    _playwright_mcp_seen = 0.0
+
+    # Created on demand by generate_output_folder, whose makedirs builds parents
+    output_base_dir = os.path.join(os.getcwd(), "claude_code_outputs")
 
     def send_progress(self, message: str, unique_id: str):
         """Send progress update to UI"""
@@ -123,40 +317,37 @@ class ClaudeRedditScraper:
 
     def ensure_playwright_mcp(self, unique_id: str) -> bool:
         """Ensure Playwright MCP is configured"""
+        seen = ClaudeRedditScraper._playwright_mcp_seen
+        if seen and time.monotonic() - seen < self.PLAYWRIGHT_MCP_TTL:
+            return True
+
         try:
             # Check if already configured
-            result = subprocess.run(
-                ["claude", "mcp", "list", "--json"],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            result = run_claude(["mcp", "list", "--json"], shared=True)
 
             if result.returncode == 0:
-                mcps = json.loads(result.stdout)
+                mcps = _json.loads(result.stdout)
                 if any(mcp.get("name") == "playwright" for mcp in mcps):
                     self.send_progress("Playwright MCP already configured", unique_id)
+                    ClaudeRedditScraper._playwright_mcp_seen = time.monotonic()
                     return True
 
             # Add Playwright MCP
             self.send_progress("Configuring Playwright MCP...", unique_id)
-            result = subprocess.run(
+            result = run_claude(
                 [
-                    "claude",
                     "mcp",
                     "add-json",
                     "--scope",
                     "user",
                     "playwright",
                     '{"command": "playwright-mcp-server"}',
-                ],
-                capture_output=True,
-                text=True,
-                check=False,
+                ]
             )
 
             if result.returncode == 0:
                 self.send_progress("Playwright MCP configured successfully", unique_id)
+                ClaudeRedditScraper._playwright_mcp_seen = time.monotonic()
                 return True
             else:
                 self.send_progress(
@@ -177,171 +368,112 @@ class ClaudeRedditScraper:
             return source
         elif source_type == "subreddit":
             # Clean subreddit name
-            subreddit = source.strip().lstrip("/r/")
+            subreddit = _SUBREDDIT_PREFIX.sub("", source, count=1).rstrip()
             if sort_by in ["top", "controversial"]:
                 return f"https://reddit.com/r/{subreddit}/{sort_by}/?t={time_filter}"
             else:
                 return f"https://reddit.com/r/{subreddit}/{sort_by}/"
         elif source_type == "search":
             # Search query
-            return f"https://reddit.com/search/?q={source}"
+            return f"https://reddit.com/search/?q={quote_plus(source.strip())}"
         elif source_type == "user":
             # User profile
-            username = source.strip().lstrip("/u/").lstrip("u/")
+            username = _USER_PREFIX.sub("", source, count=1).rstrip()
             return f"https://reddit.com/user/{username}"
         else:
             return source
 
     def build_scraping_prompt(
         self, params: Dict[str, Any], output_folder: str, memory: str
-    ) -> str:
-        """Build the complete prompt for Reddit scraping"""
-        url = params["url"]
-        scrape_mode = params["scrape_mode"]
-        max_items = params["max_items"]
-        include_metadata = params["include_metadata"]
-        max_comment_depth = params.get("max_comment_depth", 2)
-
-        parts = []
-
-        # Add memory if provided
-        if memory:
-            parts.append("# Context/Memory\n")
-            parts.append(memory)
-            parts.append("\n\n")
-
-        # Add main command
-        parts.append("# Command\n")
-        parts.append(f"Use the Playwright MCP to scrape Reddit data from: {url}\n\n")
-
-        parts.append("## Scraping Instructions:\n")
-        parts.append("1. Navigate to the URL\n")
-        parts.append("2. Wait for the page to load completely\n")
-        parts.append("3. Scrape the following data:\n")
-
-        if scrape_mode in ["posts", "both"]:
-            parts.append(f"\n### Posts (first {max_items} items):\n")
-            parts.append("- Title\n")
-            parts.append("- URL/link\n")
-            parts.append("- Subreddit\n")
-
-            if include_metadata:
-                parts.append("- Author username\n")
-                parts.append("- Score/upvotes\n")
-                parts.append("- Number of comments\n")
-                parts.append("- Post time\n")
-                parts.append("- Awards (if any)\n")
-                parts.append("- Post flair\n")
-                parts.append("- Whether it's pinned/stickied\n")
-
-        if scrape_mode in ["comments", "both"]:
-            if scrape_mode == "comments":
-                parts.append(f"\n### Comments (from first {max_items} posts):\n")
-                parts.append("- Find the post with the most comments (at least 20+ comments)\n")
-                parts.append("- Click into that specific post to view the full comment thread\n")
-            else:
-                parts.append(f"\n### Comments (for each scraped post):\n")
-                parts.append("- Click into each post\n")
-
-            parts.append(f"- Scrape ALL visible comments up to {max_comment_depth} levels deep\n")
-            parts.append("- For each comment, capture:\n")
-            parts.append("  * Full comment text (don't truncate)\n")
-            parts.append("  * Author username\n")
-            parts.append("  * Score/upvotes\n")
-            parts.append("  * Timestamp\n")
-            parts.append("  * Comment ID (if available)\n")
-            parts.append("  * Parent comment ID (to preserve threading)\n")
-            parts.append("  * Depth level (0=top-level, 1=reply, 2=reply-to-reply, etc.)\n")
-            parts.append("  * Awards (if any)\n")
-            parts.append("  * Whether it's highlighted/pinned\n")
-            parts.append("- Expand 'Continue this thread' links to get deeper comments\n")
-            parts.append("- Include deleted/removed comments with appropriate markers\n")
-            parts.append("- Preserve the exact thread hierarchy in nested structure\n")
-
-        if scrape_mode == "metadata":
-            parts.append("\n### Subreddit Metadata:\n")
-            parts.append("- Subreddit name and description\n")
-            parts.append("- Member count\n")
-            parts.append("- Rules\n")
-            parts.append("- Moderators (if visible)\n")
-            parts.append("- Pinned posts\n")
-            parts.append("- Sidebar information\n")
-
-        parts.append("\n## Data Processing:\n")
-        parts.append("- Structure the data as clean JSON with this format:\n")
-        parts.append("```json\n")
-        parts.append("{\n")
-        parts.append('  "post": {\n')
-        parts.append('    "title": "...",\n')
-        parts.append('    "url": "...",\n')
-        parts.append('    "author": "...",\n')
-        parts.append('    "score": 123,\n')
-        parts.append('    "content": "...",\n')
-        parts.append('    "num_comments": 45\n')
-        parts.append('  },\n')
-        parts.append('  "comments": [\n')
-        parts.append('    {\n')
-        parts.append('      "id": "abc123",\n')
-        parts.append('      "parent_id": null,\n')
-        parts.append('      "author": "username",\n')
-        parts.append('      "text": "Full comment text...",\n')
-        parts.append('      "score": 10,\n')
-        parts.append('      "timestamp": "2 hours ago",\n')
-        parts.append('      "depth": 0,\n')
-        parts.append('      "awards": 1,\n')
-        parts.append('      "is_highlighted": false,\n')
-        parts.append('      "replies": [\n')
-        parts.append('        {\n')
-        parts.append('          "id": "def456",\n')
-        parts.append('          "parent_id": "abc123",\n')
-        parts.append('          "author": "another_user",\n')
-        parts.append('          "text": "Reply text...",\n')
-        parts.append('          "score": 5,\n')
-        parts.append('          "timestamp": "1 hour ago",\n')
-        parts.append('          "depth": 1,\n')
-        parts.append('          "replies": []\n')
-        parts.append('        }\n')
-        parts.append('      ]\n')
-        parts.append('    }\n')
-        parts.append('  ],\n')
-        parts.append('  "metadata": {\n')
-        parts.append('    "total_comments_scraped": 45,\n')
-        parts.append('    "max_depth_reached": 3,\n')
-        parts.append('    "scraped_at": "2024-06-16T16:00:00Z"\n')
-        parts.append('  }\n')
-        parts.append("}\n")
-        parts.append("```\n")
-        parts.append("- Use consistent field names\n")
-        parts.append("- Handle missing data gracefully (use null)\n")
-        parts.append("- Include a summary count of items scraped\n")
-        parts.append("- If any errors occur, include them in an 'errors' field\n")
-
-        parts.append("\n# Output Instructions\n")
-        parts.append(
-            f"Save all scraped data to a file named 'reddit_data.json' in: {output_folder}\n"
+    ) -> bytes:
+        """Build the complete prompt for Reddit scraping, ready to pipe to the CLI"""
+        # Only the URL and scrape shape feed the body, so repeat runs reuse it
+        body = _prompt_body(
+            params["url"],
+            params["scrape_mode"],
+            params["max_items"],
+            params.get("max_comment_depth", 2),
+            params["include_metadata"],
+        )
+        memory_header = f"# Context/Memory\n{memory}\n\n".encode() if memory else b""
+
+        return (
+            memory_header
+            + body
+            + _OUTPUT_INSTRUCTIONS.format(output_folder=output_folder).encode()
         )
-        parts.append("Also create a 'scraping_summary.txt' file with:\n")
-        parts.append("- Post title and URL\n")
-        parts.append("- Total comments scraped\n")
-        parts.append("- Top 5 comments by score (with author and score)\n")
-        parts.append("- Most controversial comments (lowest/negative scores)\n")
-        parts.append("- Thread depth statistics\n")
-        parts.append("- Key discussion themes or topics mentioned\n")
-        parts.append("- Any issues encountered\n")
-        parts.append("- Timestamp of scraping\n")
-        parts.append("\nDo not create files elsewhere.\n")
-
-        return "".join(parts)
 
     def generate_output_folder(self) -> Tuple[str, str]:
         """Generate unique output folder"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = os.urandom(4).hex()
         folder_name = f"reddit_scrape_{timestamp}_{unique_id}"
         folder_path = os.path.join(self.output_base_dir, folder_name)
         os.makedirs(folder_path, exist_ok=True)
         return folder_name, folder_path
 
+    def run_scrape(self, cmd_parts: List[str], prompt: bytes, folder_path: str) -> int:
+        """
+        Run the scraping command and return its exit code.
+        Claude's stdout is never used, so it is discarded instead of buffered;
+        stderr goes straight to disk and is kept as error_log.txt only when
+        the command fails or times out.
+        """
+        stderr_path = os.path.join(folder_path, "_claude_stderr.log")
+        returncode = None
+        try:
+            with open(stderr_path, "wb") as stderr_file:
+                proc = subprocess.Popen(
+                    cmd_parts,
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.DEVNULL,
+                    stderr=stderr_file,
+                    cwd=folder_path,
+                )
+                try:
+                    # 10 minute timeout for complex scraping
+                    if len(prompt) <= _PIPE_BUFFER_BYTES:
+                        # Fits in the pipe buffer, so the write cannot block and
+                        # there is nothing for communicate() to multiplex
+                        assert proc.stdin is not None
+                        try:
+                            proc.stdin.write(prompt)
+                            proc.stdin.close()
+                        except BrokenPipeError:
+                            # Claude exited early; its exit code reports why
+                            pass
+                        proc.wait(timeout=600)
+                    else:
+                        proc.communicate(prompt, timeout=600)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                    raise
+                returncode = proc.returncode
+        finally:
+            try:
+                if returncode != 0 and os.path.getsize(stderr_path):
+                    os.replace(stderr_path, os.path.join(folder_path, "error_log.txt"))
+                else:
+                    os.remove(stderr_path)
+            except OSError:
+                pass
+        return returncode
+
+    def _build_metadata(
+        self, folder_path: str, include_files: bool, **fields: Any
+    ) -> Dict[str, Any]:
+        """
+        Metadata for a scrape run, in the order the fields are given.
+        The output folder is only listed when include_files is set, so
+        timeout and error paths skip the directory read.
+        """
+        metadata = dict(fields)
+        if include_files:
+            with os.scandir(folder_path) as it:
+                metadata["files"] = [entry.name for entry in it if entry.is_file()]
+        return metadata
+
     def read_scraped_data(self, folder_path: str) -> Tuple[Dict[str, Any], str, int]:
         """Read the scraped data from output files"""
         scraped_data = {}
@@ -350,33 +482,33 @@ class ClaudeRedditScraper:
 
         # Read reddit_data.json
         data_file = os.path.join(folder_path, "reddit_data.json")
-        if os.path.exists(data_file):
-            try:
-                with open(data_file, "r") as f:
-                    scraped_data = json.load(f)
-
-                # Count items
-                if isinstance(scraped_data, list):
-                    item_count = len(scraped_data)
-                elif isinstance(scraped_data, dict):
-                    if "posts" in scraped_data:
-                        item_count = len(scraped_data.get("posts", []))
-                    elif "data" in scraped_data:
-                        item_count = len(scraped_data.get("data", []))
-                    else:
-                        item_count = 1
-
-            except Exception as e:
-                scraped_data = {"error": f"Failed to read data file: {str(e)}"}
+        try:
+            with open(data_file, "rb") as f:
+                scraped_data = _json.loads(f.read())
+
+            # Count items
+            if isinstance(scraped_data, list):
+                item_count = len(scraped_data)
+            elif isinstance(scraped_data, dict):
+                if "posts" in scraped_data:
+                    item_count = len(scraped_data.get("posts", []))
+                elif "data" in scraped_data:
+                    item_count = len(scraped_data.get("data", []))
+                else:
+                    item_count = 1
+
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            scraped_data = {"error": f"Failed to read data file: {str(e)}"}
 
-        # Read summary
+        # Read summary; a missing file keeps the default
         summary_file = os.path.join(folder_path, "scraping_summary.txt")
-        if os.path.exists(summary_file):
-            try:
-                with open(summary_file, "r") as f:
-                    summary = f.read().strip()
-            except:
-                pass
+        try:
+            with open(summary_file, "r") as f:
+                summary = f.read().strip()
+        except:
+            pass
 
         if item_count > 0 and not summary.startswith("No data"):
             return scraped_data, summary, item_count
@@ -406,35 +538,47 @@ class ClaudeRedditScraper:
 
         self.send_progress("Initializing Reddit scraper...", unique_id)
 
-        # Ensure Playwright MCP is configured
-        if not self.ensure_playwright_mcp(unique_id):
+        # Ensure Playwright MCP is configured; the check may shell out to the
+        # CLI, so prepare the folder, URL and prompt while it runs
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            mcp_check = pool.submit(self.ensure_playwright_mcp, unique_id)
+
+            # Generate output folder
+            folder_name, folder_path = self.generate_output_folder()
+
+            # Build Reddit URL
+            url = self.build_reddit_url(source_type, source, sort_by, time_filter)
+
+            # Build complete prompt
+            prompt = self.build_scraping_prompt(
+                {
+                    "url": url,
+                    "scrape_mode": scrape_mode,
+                    "max_items": max_items,
+                    "include_metadata": include_metadata,
+                    "max_comment_depth": max_comment_depth,
+                },
+                folder_path,
+                memory or "",
+            )
+
+            mcp_ok = mcp_check.result()
+
+        if not mcp_ok:
+            # Nothing was written to the folder yet
+            try:
+                os.rmdir(folder_path)
+            except OSError:
+                pass
             error_output = {"error": "Failed to configure Playwright MCP"}
             return (error_output, {}, "Failed to configure Playwright MCP", 0)
 
-        # Generate output folder
-        folder_name, folder_path = self.generate_output_folder()
         self.send_progress(f"Created output folder: {folder_name}", unique_id)
-
-        # Build Reddit URL
-        url = self.build_reddit_url(source_type, source, sort_by, time_filter)
         self.send_progress(f"Target URL: {url}", unique_id)
 
-        # Build complete prompt
-        prompt = self.build_scraping_prompt(
-            {
-                "url": url,
-                "scrape_mode": scrape_mode,
-                "max_items": max_items,
-                "include_metadata": include_metadata,
-                "max_comment_depth": max_comment_depth,
-            },
-            folder_path,
-            memory or "",
-        )
-
         # Build CLI command
         cmd_parts = [
-            "claude",
+            CLAUDE_BIN,
             "-p",
             "--max-turns",
             "15",  # More turns for complex scraping
@@ -451,27 +595,16 @@ class ClaudeRedditScraper:
         start_time = datetime.now()
 
         try:
-            result = subprocess.run(
-                cmd_parts,
-                input=prompt,
-                cwd=folder_path,
-                capture_output=True,
-                text=True,
-                check=False,
-                timeout=600,  # 10 minute timeout for complex scraping
-            )
+            returncode = self.run_scrape(cmd_parts, prompt, folder_path)
 
-            duration = (datetime.now() - start_time).total_seconds()
+            end_time = datetime.now()
+            duration = (end_time - start_time).total_seconds()
 
-            # Log any errors
-            if result.returncode != 0:
+            # Log any errors (stderr is already saved to error_log.txt)
+            if returncode != 0:
                 self.send_progress(
-                    f"Warning: Command exited with code {result.returncode}", unique_id
+                    f"Warning: Command exited with code {returncode}", unique_id
                 )
-                if result.stderr:
-                    error_log = os.path.join(folder_path, "error_log.txt")
-                    with open(error_log, "w") as f:
-                        f.write(result.stderr)
 
             # Read scraped data from files
             scraped_data, summary, item_count = self.read_scraped_data(folder_path)
@@ -484,31 +617,28 @@ class ClaudeRedditScraper:
                 self.send_progress("Scraping completed but no data found", unique_id)
 
             # Create metadata
-            metadata = {
-                "source_type": source_type,
-                "source": source,
-                "url": url,
-                "scrape_mode": scrape_mode,
-                "max_items_requested": max_items,
-                "items_scraped": item_count,
-                "sort_by": sort_by,
-                "time_filter": time_filter,
-                "include_metadata": include_metadata,
-                "duration_seconds": duration,
-                "timestamp": datetime.now().isoformat(),
-                "model": model,
-                "folder": folder_name,
-                "files": [
-                    f
-                    for f in os.listdir(folder_path)
-                    if os.path.isfile(os.path.join(folder_path, f))
-                ],
-            }
+            metadata = self._build_metadata(
+                folder_path,
+                include_files=True,
+                source_type=source_type,
+                source=source,
+                url=url,
+                scrape_mode=scrape_mode,
+                max_items_requested=max_items,
+                items_scraped=item_count,
+                sort_by=sort_by,
+                time_filter=time_filter,
+                include_metadata=include_metadata,
+                duration_seconds=duration,
+                timestamp=end_time.isoformat(),
+                model=model,
+                folder=folder_name,
+            )
 
             # Save metadata
             metadata_file = os.path.join(folder_path, "_claude_code_metadata.json")
-            with open(metadata_file, "w") as f:
-                json.dump(metadata, f, indent=2)
+            with open(metadata_file, "wb") as f:
+                f.write(_json.dumpb(metadata, indent=True))
 
             # Create CLAUDE_OUTPUT compatible output
             output = {"folder": folder_name, "response": summary, "metadata": metadata}
@@ -525,7 +655,9 @@ class ClaudeRedditScraper:
                 output = {
                     "folder": folder_name,
                     "response": f"Partial data scraped before timeout: {item_count} items",
-                    "metadata": {"error": error_msg, "partial_data": True},
+                    "metadata": self._build_metadata(
+                        folder_path, include_files=False, error=error_msg, partial_data=True
+                    ),
                 }
                 return (
                     output,
@@ -2,40 +2,61 @@
 Claude Code ComfyUI Nodes
 """
 
-# Core execution nodes
-from .claude_code_execute import ClaudeCodeExecute
+import importlib
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Dict
 
-# Helper/builder nodes
-from .claude_code_memory import ClaudeCodeMemory
-from .claude_code_arguments import ClaudeCodeArguments
-from .claude_code_tools import ClaudeCodeTools
-from .claude_code_mcp import ClaudeCodeMCP
+# Node class name -> module defining it; modules are imported on first use
+_NODE_MODULES: Dict[str, str] = {
+    # Core execution nodes
+    "ClaudeCodeExecute": "claude_code_execute",
+    # Helper/builder nodes
+    "ClaudeCodeMemory": "claude_code_memory",
+    "ClaudeCodeArguments": "claude_code_arguments",
+    "ClaudeCodeTools": "claude_code_tools",
+    "ClaudeCodeMCP": "claude_code_mcp",
+    # Utility nodes
+    "ClaudeCodeReader": "claude_code_reader",
+    "ClaudeCodeContext": "claude_code_context",
+    # Scraper nodes
+    "ClaudeRedditScraper": "claude_reddit_scraper",
+}
+
+
+def __getattr__(name: str) -> type:
+    """Import a node class the first time it is accessed on this module."""
+    module_name = _NODE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    node_class: type = getattr(importlib.import_module(f".{module_name}", __package__), name)
+    globals()[name] = node_class
+    return node_class
+
+
+class _LazyNodeMapping(Mapping[str, type]):
+    """Read-only node name -> class mapping that imports each class on lookup."""
+
+    def __getitem__(self, name: str) -> type:
+        if name not in _NODE_MODULES:
+            raise KeyError(name)
+        return __getattr__(name)
 
-# Utility nodes
-from .claude_code_reader import ClaudeCodeReader
-from .claude_code_context import ClaudeCodeContext
+    def __iter__(self) -> Iterator[str]:
+        return iter(_NODE_MODULES)
+
+    def __len__(self) -> int:
+        return len(_NODE_MODULES)
+
+    def __contains__(self, name: object) -> bool:
+        return name in _NODE_MODULES
 
-# Scraper nodes
-from .claude_reddit_scraper import ClaudeRedditScraper
 
 # Node class mappings
-NODE_CLASS_MAPPINGS = {
-    # Core nodes
-    "ClaudeCodeExecute": ClaudeCodeExecute,
-    # Helper nodes
-    "ClaudeCodeMemory": ClaudeCodeMemory,
-    "ClaudeCodeArguments": ClaudeCodeArguments,
-    "ClaudeCodeTools": ClaudeCodeTools,
-    "ClaudeCodeMCP": ClaudeCodeMCP,
-    # Utility nodes
-    "ClaudeCodeReader": ClaudeCodeReader,
-    "ClaudeCodeContext": ClaudeCodeContext,
-    # Scraper nodes
-    "ClaudeRedditScraper": ClaudeRedditScraper,
-}
+NODE_CLASS_MAPPINGS = _LazyNodeMapping()
 
-# Display name mappings
-NODE_DISPLAY_NAME_MAPPINGS = {
+# Display name mappings (read-only, like NODE_CLASS_MAPPINGS)
+NODE_DISPLAY_NAME_MAPPINGS = MappingProxyType({
     # Core nodes
     "ClaudeCodeExecute": "Claude Code Execute",
     # Helper nodes
@@ -48,4 +69,4 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "ClaudeCodeContext": "Claude Context Builder",
     # Scraper nodes
     "ClaudeRedditScraper": "Claude Reddit Scraper",
-}
+})
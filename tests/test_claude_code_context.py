@@ -0,0 +1,53 @@
+"""Tests for the ClaudeCodeContext node's file listing and summaries."""
+
+import os
+
+import pytest
+from src.claude_code_comfyui_nodes.claude_code_context import ClaudeCodeContext
+
+
+@pytest.fixture
+def context(tmp_path, monkeypatch):
+    """A context builder whose output base dir holds one folder, "out"."""
+    (tmp_path / "out").mkdir()
+    monkeypatch.setattr(ClaudeCodeContext, "output_base_dir", str(tmp_path))
+    return ClaudeCodeContext()
+
+
+def write(tmp_path, rel_path, data):
+    path = tmp_path / "out" / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def test_files_are_listed_by_path_components(context, tmp_path):
+    for rel_path in ["sub-x/z.md", "sub/a.md", "a.md"]:
+        write(tmp_path, rel_path, b"x")
+    (result,) = context.build_context("out", "file_list", file_filter="md")
+    listed = [line[2:].split(" (")[0] for line in result.splitlines() if line.startswith("- ")]
+    assert [p.replace("\\", "/") for p in listed] == ["a.md", "sub/a.md", "sub-x/z.md"]
+
+
+def test_summary_reads_heads_as_text(context, tmp_path):
+    write(tmp_path, "crlf.txt", b"line\r\n" * (ClaudeCodeContext.SUMMARY_CHARS // 5))
+    write(tmp_path, "latin.txt", b"caf\xe9\n")
+    (result,) = context.build_context("out", "summary", file_filter="txt")
+    assert "\r" not in result
+    assert "... [truncated]" not in result
+    assert "[Error reading file:" in result
+
+
+def test_unreadable_subdirectories_are_skipped(context, tmp_path, monkeypatch):
+    for rel_path in ["a.md", "locked/b.md", "open/c.md"]:
+        write(tmp_path, rel_path, b"x")
+    scandir = os.scandir
+
+    def guarded_scandir(path):
+        if os.path.basename(path) == "locked":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", guarded_scandir)
+    (result,) = context.build_context("out", "file_list", file_filter="md")
+    assert "a.md" in result and "c.md" in result
+    assert "b.md" not in result
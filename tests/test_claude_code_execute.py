@@ -0,0 +1,55 @@
+"""Tests for the ClaudeCodeExecute node's CLI process handling."""
+
+import sys
+import threading
+
+import pytest
+from src.claude_code_comfyui_nodes.claude_code_execute import ClaudeCodeExecute
+
+# Emits more than a pipe buffer of invalid UTF-8 on both streams, then echoes stdin
+FAKE_CLI = (
+    "import sys\n"
+    "sys.stdout.buffer.write(b'\\xff progress\\n' * 100000)\n"
+    "sys.stderr.buffer.write(b'\\xfe warning\\n' * 100000)\n"
+    "sys.stdout.buffer.write(sys.stdin.buffer.read())\n"
+)
+
+
+@pytest.fixture
+def executor(tmp_path, monkeypatch):
+    monkeypatch.setattr(ClaudeCodeExecute, "output_base_dir", str(tmp_path / "outputs"))
+    return ClaudeCodeExecute()
+
+
+def run_with_timeout(executor, timeout=30):
+    result = []
+    thread = threading.Thread(
+        target=lambda: result.append(
+            executor.run_claude([sys.executable, "-c", FAKE_CLI], "the prompt", ".", "node-1")
+        ),
+        daemon=True,
+    )
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), "run_claude hung"
+    return result[0]
+
+
+def test_undecodable_output_and_failing_progress_do_not_hang(executor, monkeypatch):
+    def broken_progress(message, unique_id):
+        raise RuntimeError("UI went away")
+
+    monkeypatch.setattr(executor, "send_progress", broken_progress)
+    returncode, stdout, stderr = run_with_timeout(executor)
+    assert returncode == 0
+    assert stdout.count("� progress\n") == 100000
+    assert stdout.endswith("the prompt")
+    assert stderr.count("� warning\n") == 100000
+
+
+def test_progress_is_forwarded_per_line(executor, monkeypatch):
+    messages = []
+    monkeypatch.setattr(executor, "send_progress", lambda message, unique_id: messages.append(message))
+    run_with_timeout(executor)
+    assert messages[0] == "� progress"
+    assert messages[-1] == "the prompt"
@@ -0,0 +1,151 @@
+"""Tests for the ClaudeCodeMCP node's config-file MCP listing."""
+
+import json
+import os
+import subprocess
+
+import pytest
+from src.claude_code_comfyui_nodes import claude_code_mcp
+from src.claude_code_comfyui_nodes.claude_code_mcp import ClaudeCodeMCP, read_mcp_servers
+
+CLI_LIST = [{"name": "from-cli", "command": "cli"}]
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    """Point the user config at tmp_path/.claude.json and run from tmp_path/project."""
+    project_dir = tmp_path / "project"
+    project_dir.mkdir()
+    monkeypatch.chdir(project_dir)
+    monkeypatch.setattr(claude_code_mcp, "_config_cache", {})
+    path = tmp_path / ".claude.json"
+    monkeypatch.setattr(claude_code_mcp, "CLAUDE_CONFIG_PATH", str(path))
+    return path
+
+
+@pytest.fixture
+def cli_calls(monkeypatch):
+    """Replace the CLI with one that lists CLI_LIST, recording each call's args."""
+    calls = []
+
+    def fake_run_claude(args, shared=False):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout=json.dumps(CLI_LIST), stderr="")
+
+    monkeypatch.setattr(claude_code_mcp, "run_claude", fake_run_claude)
+    ClaudeCodeMCP.invalidate_mcp_list()
+    return calls
+
+
+def server(command):
+    return {"type": "stdio", "command": command, "args": [], "env": {"API_TOKEN": "secret"}}
+
+
+def listed(name, command):
+    """What the MCP list shows for server(command): no env."""
+    return {"name": name, "command": command, "args": []}
+
+
+def test_local_overrides_project_overrides_user(config_path):
+    config_path.write_text(json.dumps({
+        "mcpServers": {"a": server("user-a"), "b": server("user-b"), "c": server("user-c")},
+        "projects": {
+            os.getcwd(): {"mcpServers": {"c": server("local-c"), "d": server("local-d")}},
+            "/elsewhere": {"mcpServers": {"a": server("other-a")}},
+        },
+    }))
+    (config_path.parent / "project" / ".mcp.json").write_text(json.dumps({
+        "mcpServers": {"b": server("project-b"), "c": server("project-c")},
+    }))
+    commands = {mcp["name"]: mcp["command"] for mcp in read_mcp_servers()}
+    assert commands == {"a": "user-a", "b": "project-b", "c": "local-c", "d": "local-d"}
+
+
+def test_project_config_alone_is_read(config_path):
+    (config_path.parent / "project" / ".mcp.json").write_text(json.dumps({"mcpServers": {"p": server("p")}}))
+    assert read_mcp_servers() == [listed("p", "p")]
+
+
+def test_credentials_are_left_out(config_path):
+    config_path.write_text(json.dumps({
+        "mcpServers": {
+            "local": server("cmd"),
+            "remote": {"type": "http", "url": "https://mcp.example", "headers": {"Authorization": "Bearer secret"}},
+        },
+    }))
+    mcp_list = read_mcp_servers()
+    assert mcp_list == [listed("local", "cmd"), {"name": "remote", "type": "http", "url": "https://mcp.example"}]
+    info, _, _ = ClaudeCodeMCP().manage_mcp("list", list_format="json")
+    assert "secret" not in info
+
+
+def test_missing_configs_raise(config_path):
+    with pytest.raises(FileNotFoundError):
+        read_mcp_servers()
+
+
+def test_list_is_a_copy_of_the_cached_config(config_path):
+    config_path.write_text(json.dumps({"mcpServers": {"a": server("a")}}))
+    read_mcp_servers()[0]["args"].append("mutated")
+    assert read_mcp_servers()[0]["args"] == []
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        b'{"mcpServers": {"x": "str"}}',
+        b'{"mcpServers": ["x"]}',
+        b'["not", "an", "object"]',
+        b'{"mcpServers": {',
+        b'\xff\xfe',
+    ],
+)
+def test_malformed_config_falls_back_to_cli(config_path, cli_calls, contents):
+    config_path.write_bytes(contents)
+    assert ClaudeCodeMCP().get_mcp_list() == CLI_LIST
+    assert cli_calls == [["mcp", "list", "--json"]]
+
+
+def test_unreadable_config_falls_back_to_cli(config_path, cli_calls):
+    config_path.mkdir()
+    assert ClaudeCodeMCP().get_mcp_list() == CLI_LIST
+
+
+def test_disable_lists_servers_left_in_other_scopes(config_path, monkeypatch):
+    config = {
+        "mcpServers": {"a": server("user-a")},
+        "projects": {os.getcwd(): {"mcpServers": {"a": server("local-a")}}},
+    }
+    config_path.write_text(json.dumps(config))
+
+    def remove_user_scope(args, shared=False):
+        del config["mcpServers"][args[-1]]
+        config_path.write_text(json.dumps(config))
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(claude_code_mcp, "run_claude", remove_user_scope)
+    info, status, mcp_list = ClaudeCodeMCP().manage_mcp("disable", mcp_name="a")
+    assert status == "disabled:a"
+    assert mcp_list == [listed("a", "local-a")]
+
+
+def test_enable_lists_the_written_config(config_path, monkeypatch):
+    config_path.write_text(json.dumps({"mcpServers": {}}))
+
+    def add_user_scope(args, shared=False):
+        config_path.write_text(json.dumps({"mcpServers": {args[-2]: json.loads(args[-1])}}))
+        return subprocess.CompletedProcess(args, 0, stdout="", stderr="")
+
+    monkeypatch.setattr(claude_code_mcp, "run_claude", add_user_scope)
+    info, status, mcp_list = ClaudeCodeMCP().manage_mcp("enable", mcp_name="n", mcp_config=json.dumps(server("n")))
+    assert status == "enabled:n"
+    assert mcp_list == [listed("n", "n")]
+
+
+def test_example_configs_are_returned_as_copies():
+    _, _, (examples,) = ClaudeCodeMCP().manage_mcp("config")
+    examples["slack"]["env"]["SLACK_MCP_XOXC_TOKEN"] = "changed"
+    examples.clear()
+    _, _, (fresh,) = ClaudeCodeMCP().manage_mcp("config")
+    assert fresh == claude_code_mcp.EXAMPLE_MCP_CONFIGS
+    assert fresh["slack"]["env"]["SLACK_MCP_XOXC_TOKEN"] == "your-xoxc-token"
@@ -0,0 +1,99 @@
+"""Tests for the ClaudeCodeReader node's file matching."""
+
+import glob
+import os
+
+import pytest
+from src.claude_code_comfyui_nodes.claude_code_reader import ClaudeCodeReader
+
+FILES = [
+    "a.md",
+    "b.py",
+    ".hidden.md",
+    "deep/z.md",
+    "deep/more/y.md",
+    "sub/deep/x.md",
+    "sub/x.md",
+    "s-x/a/x.md",
+    "s-x/x.md",
+    ".git/config.md",
+    "_claude_code_metadata.json",
+]
+
+
+@pytest.fixture
+def reader(tmp_path, monkeypatch):
+    """A reader whose output base dir holds one folder, "out", with FILES in it."""
+    for name in FILES:
+        path = tmp_path / "out" / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(name, encoding="utf-8")
+    monkeypatch.setattr(ClaudeCodeReader, "output_base_dir", str(tmp_path))
+    return ClaudeCodeReader()
+
+
+def listed(reader, pattern, max_files=100):
+    _, file_list, _ = reader.read_output("out", pattern, "list_files", max_files=max_files)
+    return sorted(info["path"].replace("\\", "/") for info in file_list)
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("*", ["a.md", "b.py", "deep/more/y.md", "deep/z.md", "s-x/a/x.md", "s-x/x.md", "sub/deep/x.md", "sub/x.md"]),
+        ("*.md", ["a.md", "deep/more/y.md", "deep/z.md", "s-x/a/x.md", "s-x/x.md", "sub/deep/x.md", "sub/x.md"]),
+        ("z.md", ["deep/z.md"]),
+        (".*", [".hidden.md"]),
+    ],
+)
+def test_name_patterns_match_at_any_depth(reader, pattern, expected):
+    assert listed(reader, pattern) == expected
+
+
+@pytest.mark.parametrize(
+    "pattern, expected",
+    [
+        ("deep/*.md", ["deep/z.md", "sub/deep/x.md"]),
+        ("*/*.md", ["deep/more/y.md", "deep/z.md", "s-x/a/x.md", "s-x/x.md", "sub/deep/x.md", "sub/x.md"]),
+        ("**/*.md", ["a.md", "deep/more/y.md", "deep/z.md", "s-x/a/x.md", "s-x/x.md", "sub/deep/x.md", "sub/x.md"]),
+        ("deep/**/*.md", ["deep/more/y.md", "deep/z.md", "sub/deep/x.md"]),
+        ("sub/deep/x.md", ["sub/deep/x.md"]),
+        (".git/*.md", [".git/config.md"]),
+    ],
+)
+def test_path_patterns_match_relative_paths(reader, pattern, expected):
+    assert listed(reader, pattern) == expected
+
+
+def test_max_files_limits_matches(reader):
+    assert len(listed(reader, "*", max_files=2)) == 2
+
+
+def test_read_specific_reports_missing_file(reader):
+    contents, _, _ = reader.read_output("out", "*", "read_specific", specific_file="nope.md")
+    assert contents == "File 'nope.md' not found in output folder"
+
+
+@pytest.mark.parametrize("pattern", ["*", "*.md", "x.md", "*/*.md", "*/x.md", "**", "**/*.md", "s-x/**", "*/*/*"])
+@pytest.mark.parametrize("max_files", [2, 100])
+def test_matches_come_in_glob_order(reader, tmp_path, pattern, max_files):
+    root = str(tmp_path / "out")
+    expected = []
+    for path in glob.iglob(os.path.join(root, "**", pattern), recursive=True):
+        rel_path = os.path.relpath(path, root)
+        if os.path.isfile(path) and rel_path not in expected and rel_path != "_claude_code_metadata.json":
+            expected.append(rel_path)
+    _, file_list, _ = reader.read_output("out", pattern, "list_files", max_files=max_files)
+    assert [info["path"] for info in file_list] == expected[:max_files]
+
+
+def test_unreadable_subdirectories_are_skipped(reader, monkeypatch):
+    scandir = os.scandir
+
+    def guarded_scandir(path):
+        if os.path.basename(path) == "deep":
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", guarded_scandir)
+    assert listed(reader, "*.md") == ["a.md", "s-x/a/x.md", "s-x/x.md", "sub/x.md"]
@@ -0,0 +1,37 @@
+"""Tests for the ClaudeRedditScraper node's Playwright MCP check."""
+
+import json
+import subprocess
+
+import pytest
+from src.claude_code_comfyui_nodes import claude_reddit_scraper
+from src.claude_code_comfyui_nodes.claude_reddit_scraper import ClaudeRedditScraper
+
+
+@pytest.fixture
+def cli_calls(monkeypatch):
+    """A CLI whose MCP list always contains playwright, recording each call's args."""
+    calls = []
+
+    def fake_run_claude(args, shared=False):
+        calls.append(args)
+        return subprocess.CompletedProcess(args, 0, stdout=json.dumps([{"name": "playwright"}]), stderr="")
+
+    monkeypatch.setattr(claude_reddit_scraper, "run_claude", fake_run_claude)
+    monkeypatch.setattr(ClaudeRedditScraper, "_playwright_mcp_seen", 0.0)
+    return calls
+
+
+def test_registration_is_trusted_within_the_ttl(cli_calls):
+    scraper = ClaudeRedditScraper()
+    assert scraper.ensure_playwright_mcp("")
+    assert scraper.ensure_playwright_mcp("")
+    assert len(cli_calls) == 1
+
+
+def test_registration_is_rechecked_after_the_ttl(cli_calls, monkeypatch):
+    scraper = ClaudeRedditScraper()
+    monkeypatch.setattr(ClaudeRedditScraper, "PLAYWRIGHT_MCP_TTL", 0.0)
+    assert scraper.ensure_playwright_mcp("")
+    assert scraper.ensure_playwright_mcp("")
+    assert len(cli_calls) == 2
@@ -0,0 +1,28 @@
+"""Tests for the shared file helpers."""
+
+import pytest
+from src.claude_code_comfyui_nodes import _files
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    _files._read_cached.cache_clear()
+    yield
+    _files._read_cached.cache_clear()
+
+
+def test_small_files_are_cached_until_changed(tmp_path):
+    path = tmp_path / "a.md"
+    path.write_text("one", encoding="utf-8")
+    assert _files.read_text_cached(str(path)) == "one"
+    assert _files.read_text_cached(str(path)) == "one"
+    assert _files._read_cached.cache_info().hits == 1
+    path.write_text("two!", encoding="utf-8")
+    assert _files.read_text_cached(str(path)) == "two!"
+
+
+def test_large_files_bypass_the_cache(tmp_path):
+    path = tmp_path / "big.txt"
+    path.write_text("x" * (_files.CACHE_MAX_BYTES + 1), encoding="utf-8")
+    assert len(_files.read_text_cached(str(path))) == _files.CACHE_MAX_BYTES + 1
+    assert _files._read_cached.cache_info().currsize == 0
@@ -0,0 +1,31 @@
+"""Tests for the shared JSON helpers."""
+
+import json
+
+import pytest
+from src.claude_code_comfyui_nodes import _json
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"id": 123456789012345678901234567890}',
+        "-9223372036854775809",
+        "18446744073709551616",
+        '{"a": [1, 2.5, "x", null, true]}',
+        '"\\ud800"',
+    ],
+)
+def test_loads_matches_stdlib(text):
+    for data in (text, text.encode()):
+        assert _json.loads(data) == json.loads(text)
+
+
+@pytest.mark.parametrize("text", ["NaN", "[Infinity, -Infinity]"])
+def test_loads_accepts_stdlib_constants(text):
+    assert repr(_json.loads(text)) == repr(json.loads(text))
+
+
+def test_loads_raises_stdlib_error():
+    with pytest.raises(_json.JSONDecodeError):
+        _json.loads("{bad")